@@ -1,6 +1,8 @@
 """Configuration for Multi-Property Hotel PMS."""
 import os
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 
 load_dotenv()
 
@@ -60,8 +62,29 @@ class ProductionConfig(BaseConfig):
 
 class TestingConfig(BaseConfig):
     TESTING = True
+    SECRET_KEY = os.getenv("SECRET_KEY") or "testing-secret-key"  # Test client sessions need a signing key
     SQLALCHEMY_DATABASE_URI = os.getenv(
         "TEST_DATABASE_URL",
         "sqlite:///:memory:"
     )
+    # Every connection must see the same in-memory database, so hand out one
+    # shared connection (usable from the test client's threads) instead of a pool
+    if SQLALCHEMY_DATABASE_URI == "sqlite:///:memory:":
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'connect_args': {'check_same_thread': False},
+            'poolclass': StaticPool,
+        }
+    elif SQLALCHEMY_DATABASE_URI.startswith("postgresql"):
+        # Page executemany INSERTs into multi-row VALUES so fixture bulk
+        # writes are a handful of round-trips
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            **BaseConfig.SQLALCHEMY_ENGINE_OPTIONS,
+            'insertmanyvalues_page_size': 1000,
+        }
+        # Batching UPDATE/DELETE executemany is a psycopg2-only option
+        if make_url(SQLALCHEMY_DATABASE_URI).get_dialect().driver == "psycopg2":
+            SQLALCHEMY_ENGINE_OPTIONS.update(
+                executemany_mode='values_plus_batch',
+                executemany_batch_page_size=500,
+            )
     WTF_CSRF_ENABLED = False  # Simplify API and form tests
\ No newline at end of file
@@ -10,9 +10,10 @@ import secrets
 import hashlib
 import uuid
 import os
-from functools import wraps
+from functools import partial, wraps
 
 from app.extensions import db, limiter
+from app.utils.uploads import queue_derivatives, derivative_filenames, get_srcset
 from app.models import (
     Owner, Hotel, User, Role, Room, RoomType, RoomImage, RoomStatusHistory,
     Guest, Booking, Invoice, Payment, Notification, BusinessDate, NightAuditLog,
@@ -656,7 +657,8 @@ def rooms_type_add():
                     filename = f"room_type_{rt.id}_{uuid.uuid4().hex[:8]}.{ext}"
                     upload_dir = os.path.join(current_app.root_path, 'static', 'uploads', 'rooms')
                     os.makedirs(upload_dir, exist_ok=True)
-                    file.save(os.path.join(upload_dir, filename))
+                    file_path = os.path.join(upload_dir, filename)
+                    file.save(file_path)
                     
                     room_image = RoomImage(
                         room_type_id=rt.id, 
@@ -3096,27 +3098,23 @@ def restaurant():
         return redirect(url_for("hms.dashboard"))
 
     menu_items = MenuItem.query.filter_by(hotel_id=hotel_id, deleted_at=None).count()
-    tables = RestaurantTable.query.filter_by(hotel_id=hotel_id).count()
     categories = MenuCategory.query.filter_by(hotel_id=hotel_id, deleted_at=None).count()
+
+    # Total and available tables in one round-trip
+    tables, available_tables = db.session.query(
+        db.func.count(RestaurantTable.id),
+        db.func.count(db.case((RestaurantTable.status == 'available', RestaurantTable.id))),
+    ).filter(RestaurantTable.hotel_id == hotel_id).one()
     
     from datetime import datetime, date
     today_start = datetime.combine(date.today(), datetime.min.time())
     today_end = datetime.combine(date.today(), datetime.max.time())
-    today_orders = RestaurantOrder.query.filter(
-        RestaurantOrder.hotel_id == hotel_id,
-        RestaurantOrder.created_at >= today_start,
-        RestaurantOrder.created_at <= today_end
-    ).count()
-    
-    pending_orders = RestaurantOrder.query.filter_by(
-        hotel_id=hotel_id,
-        status='pending'
-    ).count()
 
-    available_tables = RestaurantTable.query.filter_by(
-        hotel_id=hotel_id,
-        status='available'
-    ).count()
+    # Today's and pending orders in one round-trip
+    today_orders, pending_orders = db.session.query(
+        db.func.count(db.case((RestaurantOrder.created_at.between(today_start, today_end), RestaurantOrder.id))),
+        db.func.count(db.case((RestaurantOrder.status == 'pending', RestaurantOrder.id))),
+    ).filter(RestaurantOrder.hotel_id == hotel_id).one()
 
     return render_template("hms/restaurant/index.html", 
                          menu_items=menu_items, 
@@ -3375,7 +3373,6 @@ def pos_order_create():
     if paid_amount > 0:
         order.paid_amount = Decimal(str(paid_amount))
         balance = RestaurantPaymentService.calculate_balance(order)
-        order.balance_due = balance
         
         if balance <= 0:
             order.payment_status = 'paid'
@@ -3507,8 +3504,8 @@ def get_active_orders():
             'total': float(order.total),
             'balance_due': float(order.balance_due) if order.balance_due else 0,
             'payment_status': order.payment_status,
-            'created_at': order.created_at.isoformat(),
-            'items_count': order.items.count()
+            'created_at': order.created_at.isoformat() if order.created_at else None,
+            'items_count': len(order.items)
         })
 
     return jsonify({'success': True, 'orders': orders_data})
@@ -3529,7 +3526,7 @@ def split_order(order_id):
     if split_ways < 2:
         return jsonify({'success': False, 'error': 'Split ways must be >= 2'}), 400
 
-    order_items = list(order.items.all())
+    order_items = list(order.items)
     if not order_items:
         return jsonify({'success': False, 'error': 'No items in order to split'}), 400
 
@@ -4965,6 +4962,26 @@ def settings_gallery():
     return render_template("hms/settings/gallery.html", images=images)
 
 
+def _store_gallery_srcset(app, image_id, file_path, widths):
+    """Record a gallery image's srcset once its derivatives are written (runs in the image worker).
+
+    If the image was deleted while the job was queued, its derivatives are removed instead.
+    """
+    gallery_dir, filename = os.path.split(file_path)
+    with app.app_context():
+        result = db.session.execute(
+            db.update(GalleryImage)
+            .where(GalleryImage.id == image_id)
+            .values(srcset=get_srcset(filename, widths, 'gallery') or None)
+        )
+        db.session.commit()
+    if result.rowcount == 0:
+        for name in derivative_filenames(filename).values():
+            derivative = os.path.join(gallery_dir, name)
+            if derivative != file_path and os.path.exists(derivative):
+                os.remove(derivative)
+
+
 @hms_bp.route('/settings/gallery/upload', methods=['GET', 'POST'])
 @login_required
 @role_required('manager', 'owner', 'superadmin')
@@ -5046,6 +5063,9 @@ def settings_gallery_upload():
             )
             db.session.add(gallery_image)
             db.session.commit()
+            queue_derivatives(file_path, on_done=partial(
+                _store_gallery_srcset, current_app._get_current_object(), gallery_image.id, file_path
+            ))
             
             flash(f"Image '{title}' uploaded successfully!", "success")
             return redirect(url_for('hms.settings_gallery'))
@@ -5104,9 +5124,11 @@ def settings_gallery_delete(image_id):
         flash("Access denied.", "danger")
         return redirect(url_for('hms.settings_gallery'))
 
-    file_path = os.path.join(current_app.root_path, 'static/uploads/gallery', image.image_filename)
-    if os.path.exists(file_path):
-        os.remove(file_path)
+    gallery_dir = os.path.join(current_app.root_path, 'static/uploads/gallery')
+    for name in [image.image_filename, *derivative_filenames(image.image_filename).values()]:
+        file_path = os.path.join(gallery_dir, name)
+        if os.path.exists(file_path):
+            os.remove(file_path)
 
     try:
         db.session.delete(image)
@@ -5271,23 +5293,20 @@ def restaurant_dashboard():
 
     today_start = datetime.combine(date.today(), datetime.min.time())
     today_end = datetime.combine(date.today(), datetime.max.time())
-    today_orders = RestaurantOrder.query.filter(
-        RestaurantOrder.hotel_id == hotel_id,
-        RestaurantOrder.created_at >= today_start,
-        RestaurantOrder.created_at <= today_end
-    ).count()
 
-    total_tables = RestaurantTable.query.filter_by(hotel_id=hotel_id).count()
-    available_tables = RestaurantTable.query.filter_by(
-        hotel_id=hotel_id, status='available'
-    ).count()
+    # Today's and pending orders in one round-trip
+    today_orders, pending_orders = db.session.query(
+        db.func.count(db.case((RestaurantOrder.created_at.between(today_start, today_end), RestaurantOrder.id))),
+        db.func.count(db.case((RestaurantOrder.status == 'pending', RestaurantOrder.id))),
+    ).filter(RestaurantOrder.hotel_id == hotel_id).one()
+
+    # Total and available tables in one round-trip
+    total_tables, available_tables = db.session.query(
+        db.func.count(RestaurantTable.id),
+        db.func.count(db.case((RestaurantTable.status == 'available', RestaurantTable.id))),
+    ).filter(RestaurantTable.hotel_id == hotel_id).one()
     occupied_tables = total_tables - available_tables
 
-    # Get pending orders
-    pending_orders = RestaurantOrder.query.filter_by(
-        hotel_id=hotel_id, status='pending'
-    ).count()
-
     stats = {
         'today_orders': today_orders,
         'total_tables': total_tables,
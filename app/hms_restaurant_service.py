@@ -51,6 +51,9 @@ class RestaurantPaymentService:
     def calculate_balance(order: RestaurantOrder) -> Decimal:
         """
         Calculate balance due for an order.
+
+        Mirrors the restaurant_orders.balance_due generated column, which
+        only refreshes once the order is flushed.
         
         Args:
             order: RestaurantOrder object
@@ -97,7 +100,6 @@ class RestaurantPaymentService:
         
         # Calculate new balance
         balance = RestaurantPaymentService.calculate_balance(order)
-        order.balance_due = balance
         
         # Update payment status
         if balance <= 0:
@@ -136,7 +138,6 @@ class RestaurantPaymentService:
         
         # Recalculate balance
         balance = RestaurantPaymentService.calculate_balance(order)
-        order.balance_due = balance
         
         # Update payment status
         if balance <= 0:
@@ -169,7 +170,6 @@ class RestaurantPaymentService:
         order.booking_id = booking_id
         order.payment_method = 'room_charge'
         order.paid_amount = order.total
-        order.balance_due = Decimal('0')
         order.payment_status = 'paid'
         
         # Create accounting entry
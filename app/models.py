@@ -1,9 +1,56 @@
+import secrets
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from flask_login import UserMixin
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql.expression import FunctionElement
 from app.extensions import db
 
 
+def to_cents(amount):
+    """Convert a money amount (Decimal, float, int or str) to integer cents."""
+    if amount is None:
+        return None
+    return int((Decimal(str(amount)) * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+
+def money_property(cents_attr, read_only=False):
+    """Expose an integer-cents column as a Decimal amount under its old name."""
+    def fget(self):
+        cents = getattr(self, cents_attr)
+        if cents is None:
+            return None
+        return (Decimal(cents) / 100).quantize(Decimal('0.01'))
+
+    def fset(self, value):
+        setattr(self, cents_attr, to_cents(value))
+
+    def expr(cls):
+        return db.cast(getattr(cls, cents_attr), db.Numeric(14, 2)) / 100
+
+    return hybrid_property(fget, None if read_only else fset, expr=expr)
+
+
+class utcnow(FunctionElement):
+    """Database-side current timestamp as naive UTC, for created_at server defaults."""
+    type = db.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
 class Owner(db.Model):
     __tablename__ = "owners"
     id = db.Column(db.Integer, primary_key=True)
@@ -127,7 +174,7 @@ class RoomType(db.Model):
     capacity = db.Column(db.Integer, default=2)
     size_sqm = db.Column(db.String(20))  # e.g. "30m²"
     bed_type = db.Column(db.String(100))  # e.g. "Double Bed", "King Bed"
-    amenities = db.Column(db.JSON)
+    amenities = db.Column(db.JSON().with_variant(JSONB(), "postgresql"))  # binary JSON on PG, no re-parse per read
     category = db.Column(db.String(50))  # classic, superior, deluxe, executive
     is_active = db.Column(db.Boolean, default=True)
     tax_rate = db.Column(db.Numeric(5, 2), default=18)
@@ -162,7 +209,7 @@ class RoomImage(db.Model):
     """Images for room types - stored in app/static/uploads/rooms/"""
     __tablename__ = "room_images"
     id = db.Column(db.Integer, primary_key=True)
-    room_type_id = db.Column(db.Integer, db.ForeignKey("room_types.id", ondelete="CASCADE"), nullable=False)
+    room_type_id = db.Column(db.Integer, db.ForeignKey("room_types.id", ondelete="CASCADE"), nullable=False, index=True)
     image_filename = db.Column(db.String(255), nullable=False)
     is_primary = db.Column(db.Boolean, default=False)
     sort_order = db.Column(db.Integer, default=0)
@@ -207,6 +254,14 @@ class Guest(db.Model):
 
 class Booking(db.Model):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Only in-house and upcoming bookings are searched by hotel and arrival date
+        db.Index(
+            "ix_bookings_active", "hotel_id", "check_in_date",
+            postgresql_where=db.text("status IN ('Reserved', 'CheckedIn')"),
+            sqlite_where=db.text("status IN ('Reserved', 'CheckedIn')"),
+        ),
+    )
     id = db.Column(db.Integer, primary_key=True)
     hotel_id = db.Column(db.Integer, db.ForeignKey("hotels.id"), nullable=False)
 
@@ -393,6 +448,15 @@ class InventoryCategory(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     deleted_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        # Names are unique per hotel among live categories; soft-deleted names can be reused
+        db.Index(
+            "uq_inventory_categories_hotel_name", "hotel_id", "name", unique=True,
+            postgresql_where=db.text("deleted_at IS NULL"),
+            sqlite_where=db.text("deleted_at IS NULL"),
+        ),
+    )
+
     items = db.relationship("InventoryItem", back_populates="category", lazy="dynamic")
 
 
@@ -455,6 +519,14 @@ class Supplier(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     deleted_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        db.Index(
+            "uq_suppliers_hotel_name", "hotel_id", "name", unique=True,
+            postgresql_where=db.text("deleted_at IS NULL"),
+            sqlite_where=db.text("deleted_at IS NULL"),
+        ),
+    )
+
     purchase_orders = db.relationship("PurchaseOrder", back_populates="supplier")
 
 
@@ -571,6 +643,15 @@ class NightAuditLog(db.Model):
 
 class APIKey(db.Model):
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Auth looks keys up by prefix among active keys only
+        db.Index(
+            "ix_api_keys_prefix_active", "key_prefix", "active",
+            postgresql_where=db.text("active = true"),
+            sqlite_where=db.text("active = 1"),
+        ),
+        db.UniqueConstraint("key_hash", name="uq_api_keys_key_hash"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     hotel_id = db.Column(db.Integer, db.ForeignKey("hotels.id"), nullable=False)
     name = db.Column(db.String(100), nullable=False)
@@ -582,13 +663,21 @@ class APIKey(db.Model):
 
     @staticmethod
     def generate_key(prefix="hk"):
-        import secrets
         raw = secrets.token_urlsafe(32)
         return f"{prefix}_{raw[:8]}_{raw[8:]}"
 
 
 class Notification(db.Model):
     __tablename__ = 'notifications'
+    __table_args__ = (
+        db.Index('ix_notifications_user_is_read', 'user_id', 'is_read'),
+        # Unread inbox, newest first; read notifications stay out of the index
+        db.Index(
+            'ix_notifications_unread', 'user_id', db.text('created_at DESC'),
+            postgresql_where=db.text('is_read = false'),
+            sqlite_where=db.text('is_read = 0'),
+        ),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     hotel_id = db.Column(db.Integer, db.ForeignKey('hotels.id'), nullable=False)
@@ -600,7 +689,7 @@ class Notification(db.Model):
     color = db.Column(db.String(20))
     is_read = db.Column(db.Boolean, default=False)
     is_archived = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     read_at = db.Column(db.DateTime)
 
     user = db.relationship('User', back_populates='notifications')
@@ -617,18 +706,22 @@ class RoomServiceOrder(db.Model):
     status = db.Column(db.String(20), default='pending')
     delivery_time = db.Column(db.DateTime)
     special_instructions = db.Column(db.Text)
-    subtotal = db.Column(db.Numeric(10, 2), default=0)
-    tax = db.Column(db.Numeric(10, 2), default=0)
-    total = db.Column(db.Numeric(10, 2), default=0)
+    # Money is stored as integer cents; the Decimal attributes wrap them
+    subtotal_cents = db.Column(db.BigInteger, default=0)
+    tax_cents = db.Column(db.BigInteger, default=0)
+    total_cents = db.Column(db.BigInteger, default=0)
+    subtotal = money_property('subtotal_cents')
+    tax = money_property('tax_cents')
+    total = money_property('total_cents')
     charge_to_room = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     delivered_at = db.Column(db.DateTime)
     delivered_by = db.Column(db.Integer, db.ForeignKey('users.id'))
     assigned_to = db.Column(db.Integer, db.ForeignKey('users.id'))
 
     room = db.relationship('Room', back_populates='room_service_orders')
     booking = db.relationship('Booking', back_populates='room_service_orders')
-    items = db.relationship('RoomServiceOrderItem', back_populates='order', lazy='dynamic', cascade='all, delete-orphan')
+    items = db.relationship('RoomServiceOrderItem', back_populates='order', lazy='selectin', cascade='all, delete-orphan')
 
 
 class RoomServiceOrderItem(db.Model):
@@ -639,7 +732,7 @@ class RoomServiceOrderItem(db.Model):
     quantity = db.Column(db.Integer, nullable=False)
     unit_price = db.Column(db.Numeric(10, 2), nullable=False)
     notes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     order = db.relationship('RoomServiceOrder', back_populates='items')
     menu_item = db.relationship('MenuItem', back_populates='order_items')
@@ -655,7 +748,7 @@ class MenuCategory(db.Model):
     display_order = db.Column(db.Integer, default=0)
     is_active = db.Column(db.Boolean, default=True)
     deleted_at = db.Column(db.DateTime, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     items = db.relationship('MenuItem', back_populates='category', lazy='dynamic')
 
@@ -675,7 +768,7 @@ class MenuItem(db.Model):
     is_available = db.Column(db.Boolean, default=True)
     image_url = db.Column(db.String(500))
     deleted_at = db.Column(db.DateTime, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     category = db.relationship('MenuCategory', back_populates='items')
     inventory_items = db.relationship('MenuItemInventory', back_populates='menu_item', cascade='all, delete-orphan')
@@ -689,7 +782,7 @@ class MenuItemInventory(db.Model):
     menu_item_id = db.Column(db.Integer, db.ForeignKey('menu_items.id'), nullable=False)
     inventory_item_id = db.Column(db.Integer, db.ForeignKey('inventory_items.id'), nullable=False)
     quantity_needed = db.Column(db.Float, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     menu_item = db.relationship('MenuItem', back_populates='inventory_items')
     inventory_item = db.relationship('InventoryItem')
@@ -705,7 +798,7 @@ class RestaurantTable(db.Model):
     status = db.Column(db.String(20), default='available')
     position_x = db.Column(db.Integer, default=0)
     position_y = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     orders = db.relationship('RestaurantOrder', back_populates='table', lazy='dynamic')
 
@@ -719,11 +812,15 @@ class RestaurantOrder(db.Model):
     guest_name = db.Column(db.String(100))
     order_type = db.Column(db.String(20), default='dine_in')
     status = db.Column(db.String(20), default='pending')
-    subtotal = db.Column(db.Numeric(10, 2), default=0)
-    tax = db.Column(db.Numeric(10, 2), default=0)
-    total = db.Column(db.Numeric(10, 2), default=0)
+    # Money is stored as integer cents; the Decimal attributes wrap them
+    subtotal_cents = db.Column(db.BigInteger, default=0)
+    tax_cents = db.Column(db.BigInteger, default=0)
+    total_cents = db.Column(db.BigInteger, default=0)
+    subtotal = money_property('subtotal_cents')
+    tax = money_property('tax_cents')
+    total = money_property('total_cents')
     special_instructions = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     completed_at = db.Column(db.DateTime)
     
     parent_order_id = db.Column(db.Integer, db.ForeignKey('restaurant_orders.id'), nullable=True)
@@ -731,13 +828,25 @@ class RestaurantOrder(db.Model):
     server_id = db.Column(db.Integer, db.ForeignKey('users.id'))
     payment_status = db.Column(db.String(20), default='unpaid')
     payment_method = db.Column(db.String(50))
-    paid_amount = db.Column(db.Numeric(10, 2), default=0)
-    discount_amount = db.Column(db.Numeric(10, 2), default=0)
-    tip_amount = db.Column(db.Numeric(10, 2), default=0)
-    balance_due = db.Column(db.Numeric(10, 2), default=0)
+    paid_amount_cents = db.Column(db.BigInteger, default=0)
+    discount_amount_cents = db.Column(db.BigInteger, default=0)
+    tip_amount_cents = db.Column(db.BigInteger, default=0)
+    # Kept in sync by the database: total - discount + tip - paid, floored at 0
+    balance_due_cents = db.Column(db.BigInteger, db.Computed(
+        "CASE WHEN COALESCE(total_cents, 0) - COALESCE(discount_amount_cents, 0)"
+        " + COALESCE(tip_amount_cents, 0) - COALESCE(paid_amount_cents, 0) > 0"
+        " THEN COALESCE(total_cents, 0) - COALESCE(discount_amount_cents, 0)"
+        " + COALESCE(tip_amount_cents, 0) - COALESCE(paid_amount_cents, 0)"
+        " ELSE 0 END",
+        persisted=True,
+    ))
+    paid_amount = money_property('paid_amount_cents')
+    discount_amount = money_property('discount_amount_cents')
+    tip_amount = money_property('tip_amount_cents')
+    balance_due = money_property('balance_due_cents', read_only=True)
 
     table = db.relationship('RestaurantTable', back_populates='orders')
-    items = db.relationship('RestaurantOrderItem', back_populates='order', lazy='dynamic', cascade='all, delete-orphan')
+    items = db.relationship('RestaurantOrderItem', back_populates='order', lazy='selectin', cascade='all, delete-orphan')
     server = db.relationship('User', foreign_keys=[server_id])
     parent_order = db.relationship('RestaurantOrder', remote_side=[id], backref='child_orders')
 
@@ -751,7 +860,7 @@ class RestaurantOrderItem(db.Model):
     unit_price = db.Column(db.Numeric(10, 2), nullable=False)
     notes = db.Column(db.Text)
     status = db.Column(db.String(20), default='pending')
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     
     modifiers = db.relationship('OrderModifier', back_populates='order_item', cascade='all, delete-orphan', lazy='dynamic')
     
@@ -767,7 +876,7 @@ class OrderModifier(db.Model):
     modifier_type = db.Column(db.String(50), nullable=False)
     modifier_value = db.Column(db.String(100), nullable=False)
     additional_price = db.Column(db.Numeric(5, 2), default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     
     order_item = db.relationship('RestaurantOrderItem', back_populates='modifiers')
 
@@ -787,7 +896,7 @@ class TableReservation(db.Model):
     status = db.Column(db.String(20), default='confirmed')
     special_requests = db.Column(db.Text)
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     
     table = db.relationship('RestaurantTable')
     booking = db.relationship('Booking')
@@ -801,6 +910,8 @@ class GalleryImage(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     hotel_id = db.Column(db.Integer, db.ForeignKey('hotels.id'), nullable=False)
     image_filename = db.Column(db.String(255), nullable=False)
+    image_url = db.Column(db.String(512))  # set from image_filename on save
+    srcset = db.Column(db.Text)  # set by the image worker once WebP derivatives are written
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
     category = db.Column(db.String(50), nullable=False)  # rooms, facilities, dining, events
@@ -816,8 +927,15 @@ class GalleryImage(db.Model):
 
     @property
     def url(self):
-        return f"/static/uploads/gallery/{self.image_filename}"
+        return self.image_url or f"/static/uploads/gallery/{self.image_filename}"
 
     @property
     def category_display(self):
         return self.category.title() if self.category else 'Gallery'
+
+
+@event.listens_for(GalleryImage, 'before_insert')
+@event.listens_for(GalleryImage, 'before_update')
+def _set_gallery_image_url(mapper, connection, target):
+    """Store the public URL once at write time so templates read it directly."""
+    target.image_url = f"/static/uploads/gallery/{target.image_filename}"
@@ -394,7 +394,7 @@ def pos_order_add_item(order_id):
     if not item or item.hotel_id != order.hotel_id:
         return jsonify({'success': False, 'error': 'Invalid item'}), 400
     unit_price = item.price
-    line = RestaurantOrderItem(order_id=order_id, menu_item_id=item.id, quantity=quantity, unit_price=unit_price)
+    line = RestaurantOrderItem(order=order, menu_item_id=item.id, quantity=quantity, unit_price=unit_price)
     db.session.add(line)
     db.session.flush()
     subtotal = sum(float(l.unit_price * l.quantity) for l in order.items)
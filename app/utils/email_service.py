@@ -2,12 +2,15 @@
 Email Service for Ngenda Hotel PMS
 Handles password reset, notifications, and other system emails.
 """
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 from flask import current_app, render_template
 from flask_mail import Message
 from app import mail
 from datetime import datetime
 
+# Shared background queue for outgoing mail; requests only pay the enqueue cost
+_mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='mail')
+
 
 def _send_async(app, msg):
     """Send a mail message in a background thread."""
@@ -18,6 +21,12 @@ def _send_async(app, msg):
             app.logger.error(f"Async email send failed: {str(e)}")
 
 
+def _enqueue(msg):
+    """Queue a mail message for delivery by the background mail worker."""
+    app = current_app._get_current_object()
+    _mail_executor.submit(_send_async, app, msg)
+
+
 def send_password_reset_email(user, reset_token):
     """
     Send password reset email to user.
@@ -41,8 +50,7 @@ def send_password_reset_email(user, reset_token):
             )
         )
 
-        app = current_app._get_current_object()
-        Thread(target=_send_async, args=(app, msg), daemon=True).start()
+        _enqueue(msg)
         current_app.logger.info(f"Password reset email queued for {user.email}")
         return True
 
@@ -74,8 +82,7 @@ def send_welcome_email(user, temporary_password=None):
             )
         )
 
-        app = current_app._get_current_object()
-        Thread(target=_send_async, args=(app, msg), daemon=True).start()
+        _enqueue(msg)
         current_app.logger.info(f"Welcome email queued for {user.email}")
         return True
 
@@ -122,8 +129,7 @@ def send_booking_notification_to_hotel(booking, room_type, nights):
             body=body,
         )
 
-        app = current_app._get_current_object()
-        Thread(target=_send_async, args=(app, msg), daemon=True).start()
+        _enqueue(msg)
         current_app.logger.info(
             f"Booking notification queued to {hotel_email} for {booking.booking_reference}"
         )
@@ -161,8 +167,7 @@ def send_contact_message_to_hotel(sender_name, sender_email, message_body):
             ),
         )
 
-        app = current_app._get_current_object()
-        Thread(target=_send_async, args=(app, msg), daemon=True).start()
+        _enqueue(msg)
         current_app.logger.info(
             f"Contact form message from {sender_email} queued to {hotel_email}"
         )
@@ -198,8 +203,7 @@ def send_user_invitation_email(user, invited_by, temporary_password):
             )
         )
 
-        app = current_app._get_current_object()
-        Thread(target=_send_async, args=(app, msg), daemon=True).start()
+        _enqueue(msg)
         current_app.logger.info(f"Invitation email queued for {user.email}")
         return True
 
@@ -4,26 +4,66 @@ Handles room images, documents, and other uploads.
 """
 import os
 import uuid
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
 
+try:
+    from PIL import Image
+except ImportError:  # Pillow not installed; images are served as uploaded
+    Image = None
+
+logger = logging.getLogger(__name__)
+
 # Allowed extensions
 ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 ALLOWED_DOCUMENT_EXTENSIONS = {'pdf', 'doc', 'docx', 'xls', 'xlsx'}
 
-# Upload folders (relative to app root)
+# Absolute path of app/static/uploads, independent of the working directory
+UPLOADS_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static', 'uploads')
+
+# Upload folders, all under UPLOADS_ROOT
 UPLOAD_FOLDERS = {
-    'rooms': 'app/static/uploads/rooms',
-    'gallery': 'app/static/uploads/gallery',
-    'logos': 'app/static/uploads/logos',
-    'documents': 'app/static/uploads/documents',
+    upload_type: os.path.join(UPLOADS_ROOT, upload_type)
+    for upload_type in ('rooms', 'gallery', 'logos', 'documents')
 }
 
+# Upload folders this process has already created
+_created_folders = set()
+
+# Maximum stored size per upload type (bytes)
+MAX_UPLOAD_BYTES = {
+    'rooms': 10 * 1024 * 1024,
+    'gallery': 10 * 1024 * 1024,
+    'logos': 2 * 1024 * 1024,
+    'documents': 16 * 1024 * 1024,
+}
+
+# Read uploads in 1 MiB chunks so memory stays bounded per request
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Responsive WebP widths written next to each gallery image
+DERIVATIVE_WIDTHS = (480, 1024, 1920)
+WEBP_QUALITY = 82
+
+# Re-encoding runs off the request thread
+_image_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='images')
+
 
 def allowed_file(filename, allowed_extensions):
     """Check if file extension is allowed."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
 
+def _upload_folder(upload_type):
+    """Return the folder for an upload type, creating it on first use."""
+    folder = UPLOAD_FOLDERS.get(upload_type, UPLOAD_FOLDERS['rooms'])
+    if folder not in _created_folders:
+        os.makedirs(folder, exist_ok=True)
+        _created_folders.add(folder)
+    return folder
+
+
 def generate_unique_filename(original_filename, prefix=''):
     """Generate a unique filename while preserving extension."""
     ext = original_filename.rsplit('.', 1)[1].lower()
@@ -42,7 +82,8 @@ def save_upload(file, upload_type='rooms', prefix=''):
         prefix: Optional prefix for the filename
     
     Returns:
-        Filename if successful, None if failed
+        Filename if successful, None if failed (including files larger
+        than MAX_UPLOAD_BYTES for the upload type)
     """
     if not file or file.filename == '':
         return None
@@ -59,19 +100,91 @@ def save_upload(file, upload_type='rooms', prefix=''):
     # Generate unique filename
     filename = generate_unique_filename(file.filename, prefix)
     
-    # Get upload folder
-    upload_folder = UPLOAD_FOLDERS.get(upload_type, UPLOAD_FOLDERS['rooms'])
-    
-    # Ensure folder exists
-    os.makedirs(upload_folder, exist_ok=True)
+    # Get upload folder, created on the first save of this type
+    upload_folder = _upload_folder(upload_type)
     
-    # Save file
+    # Stream file to disk, rejecting it once it exceeds the size limit
     filepath = os.path.join(upload_folder, filename)
-    file.save(filepath)
+    max_bytes = MAX_UPLOAD_BYTES.get(upload_type, MAX_UPLOAD_BYTES['rooms'])
+    total = 0
+    with open(filepath, 'wb') as dst:
+        while chunk := file.stream.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if total > max_bytes:
+                break
+            dst.write(chunk)
+    
+    if total > max_bytes:
+        os.remove(filepath)
+        return None
     
     return filename
 
 
+def derivative_filenames(filename):
+    """Return {width: filename} for the WebP derivatives of an image (None = full size)."""
+    stem = filename.rsplit('.', 1)[0]
+    names = {None: f"{stem}.webp"}
+    for width in DERIVATIVE_WIDTHS:
+        names[width] = f"{stem}@{width}.webp"
+    return names
+
+
+def generate_derivatives(filepath):
+    """Write a full-size WebP copy and downscaled WebP variants next to an image.
+
+    Returns the widths of the downscaled variants that were written.
+    """
+    if Image is None:
+        return []
+    folder, filename = os.path.split(filepath)
+    widths = []
+    try:
+        with Image.open(filepath) as img:
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+            for width, name in derivative_filenames(filename).items():
+                out = os.path.join(folder, name)
+                if out == filepath:
+                    continue
+                if width is None:
+                    img.save(out, 'WEBP', quality=WEBP_QUALITY)
+                elif width < img.width:
+                    height = round(img.height * width / img.width)
+                    img.resize((width, height), Image.LANCZOS).save(out, 'WEBP', quality=WEBP_QUALITY)
+                    widths.append(width)
+    except Exception as e:
+        logger.error(f"Image derivative generation failed for {filepath}: {str(e)}")
+        return []
+    return widths
+
+
+def _run_derivatives(filepath, on_done):
+    """Image worker job: write the derivatives, then report the widths to on_done."""
+    widths = generate_derivatives(filepath)
+    if on_done is None:
+        return
+    try:
+        on_done(widths)
+    except Exception as e:
+        logger.error(f"Recording image derivatives failed for {filepath}: {str(e)}")
+
+
+def queue_derivatives(filepath, on_done=None):
+    """Generate WebP derivatives for an image in the background.
+
+    on_done, if given, is called from the worker thread with the widths written.
+    """
+    if Image is not None:
+        _image_executor.submit(_run_derivatives, filepath, on_done)
+
+
+def get_srcset(filename, widths, upload_type='rooms'):
+    """Build a srcset attribute from the derivative widths written for an image."""
+    names = derivative_filenames(filename)
+    return ', '.join(f"{get_file_url(names[width], upload_type)} {width}w" for width in widths)
+
+
 def save_room_image(file, room_type_id=None):
     """Save a room image and return the filename."""
     prefix = f"room_{room_type_id}_" if room_type_id else "room_"
@@ -99,6 +212,11 @@ def delete_file(filename, upload_type='rooms'):
     upload_folder = UPLOAD_FOLDERS.get(upload_type, UPLOAD_FOLDERS['rooms'])
     filepath = os.path.join(upload_folder, filename)
     
+    for name in derivative_filenames(filename).values():
+        derivative = os.path.join(upload_folder, name)
+        if derivative != filepath and os.path.exists(derivative):
+            os.remove(derivative)
+    
     if os.path.exists(filepath):
         os.remove(filepath)
         return True
@@ -3,32 +3,46 @@
 # Simple HTML converter for API documentation
 # This script creates an HTML version of the API documentation
 
+import re
+from pathlib import Path
+
+# Markdown patterns, compiled once
+HEADER_RE = re.compile(r'^(#{1,3}) (.+)$', re.MULTILINE)
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+ITALIC_RE = re.compile(r'\*(.+?)\*')
+CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
+INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
 def convert_markdown_to_html():
     # Read the markdown files
-    with open('API_DOCUMENTATION.md', 'r') as f:
-        api_doc = f.read()
-
-    with open('SAMPLE_OUTPUTS.md', 'r') as f:
-        samples = f.read()
+    api_doc = Path('API_DOCUMENTATION.md').read_text()
+    samples = Path('SAMPLE_OUTPUTS.md').read_text()
 
     # Basic markdown conversion
     def simple_markdown(text):
-        # Headers
-        import re
-        text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-        text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-        
-        # Bold and italic
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+        # Headers (h1-h3 in a single pass)
+        if '#' in text:
+            text = HEADER_RE.sub(
+                lambda m: f'<h{len(m.group(1))}>{m.group(2)}</h{len(m.group(1))}>', text
+            )
+        
+        # Bold and italic (plain substring checks skip the regex when a
+        # marker cannot match)
+        if '*' in text:
+            text = BOLD_RE.sub(r'<strong>\1</strong>', text)
+            text = ITALIC_RE.sub(r'<em>\1</em>', text)
         
         # Code blocks
-        text = re.sub(r'```(\w+)?\n(.*?)\n```', r'<pre><code>\2</code></pre>', text, flags=re.DOTALL)
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+        if '```' in text:
+            text = CODE_BLOCK_RE.sub(r'<pre><code>\2</code></pre>', text)
+        if '`' in text:
+            text = INLINE_CODE_RE.sub(r'<code>\1</code>', text)
         
         # Links
-        text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+        if '](' in text:
+            text = LINK_RE.sub(r'<a href="\2">\1</a>', text)
         
         # Lists
         lines = text.split('\n')
@@ -223,8 +237,7 @@ def convert_markdown_to_html():
 </html>'''
 
     # Save HTML file
-    with open('HMS_API_Documentation.html', 'w') as f:
-        f.write(html_doc)
+    Path('HMS_API_Documentation.html').write_text(html_doc)
 
     print('✅ HTML documentation created successfully: HMS_API_Documentation.html')
     print('📄 You can open this file in any web browser')
@@ -20,29 +20,30 @@ def upgrade():
     # Check if columns already exist
     bind = op.get_bind()
     inspector = inspect(bind)
-    columns = [col['name'] for col in inspector.get_columns('bookings')]
+    existing = {
+        table: {col['name'] for col in inspector.get_columns(table)}
+        for table in ('bookings', 'rooms')
+    }
+    unique_constraints = {uc['name'] for uc in inspector.get_unique_constraints('bookings')}
     
     # Add columns to bookings only if they don't exist
     with op.batch_alter_table('bookings') as batch_op:
-        if 'booking_reference' not in columns:
+        if 'booking_reference' not in existing['bookings']:
             batch_op.add_column(sa.Column('booking_reference', sa.String(length=50), nullable=True))
         
-        if 'special_requests' not in columns:
+        if 'special_requests' not in existing['bookings']:
             batch_op.add_column(sa.Column('special_requests', sa.Text(), nullable=True))
         
-        if 'source' not in columns:
+        if 'source' not in existing['bookings']:
             batch_op.add_column(sa.Column('source', sa.String(length=50), nullable=True))
-    
-    # Create unique constraint
-    try:
-        op.create_unique_constraint('uq_bookings_booking_reference', 'bookings', ['booking_reference'])
-    except:
-        pass  # Constraint already exists
+        
+        # Create unique constraint
+        if 'uq_bookings_booking_reference' not in unique_constraints:
+            batch_op.create_unique_constraint('uq_bookings_booking_reference', ['booking_reference'])
 
     # Add is_active to rooms
-    room_columns = [col['name'] for col in inspector.get_columns('rooms')]
-    with op.batch_alter_table('rooms') as batch_op:
-        if 'is_active' not in room_columns:
+    if 'is_active' not in existing['rooms']:
+        with op.batch_alter_table('rooms') as batch_op:
             batch_op.add_column(sa.Column('is_active', sa.Boolean(), nullable=True, server_default='1'))
 
 
@@ -1,5 +1,8 @@
 """add notifications table
 
+Superseded by 408e6a775312, which creates the same table; kept as a no-op
+so the 7dc8073ef0d3 merge still resolves.
+
 Revision ID: 308d59664201
 Revises: 9a0b1c2d3e4f
 Create Date: 2026-02-15 21:55:00
@@ -17,26 +20,9 @@ depends_on = None
 
 
 def upgrade():
-    # Create notifications table
-    op.create_table('notifications',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('hotel_id', sa.Integer(), nullable=False),
-        sa.Column('type', sa.String(length=50), nullable=False),
-        sa.Column('title', sa.String(length=200), nullable=False),
-        sa.Column('message', sa.Text(), nullable=False),
-        sa.Column('link', sa.String(length=500), nullable=True),
-        sa.Column('icon', sa.String(length=50), nullable=True),
-        sa.Column('color', sa.String(length=20), nullable=True),
-        sa.Column('is_read', sa.Boolean(), nullable=False, default=False),
-        sa.Column('is_archived', sa.Boolean(), nullable=False, default=False),
-        sa.Column('created_at', sa.DateTime(), nullable=True),
-        sa.Column('read_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['hotel_id'], ['hotels.id'], ),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
-        sa.PrimaryKeyConstraint('id')
-    )
+    # Superseded by 408e6a775312
+    pass
 
 
 def downgrade():
-    op.drop_table('notifications')
\ No newline at end of file
+    pass
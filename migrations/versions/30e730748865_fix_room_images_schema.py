@@ -16,19 +16,32 @@ branch_labels = None
 depends_on = None
 
 
+BACKFILL_BATCH_SIZE = 10000
+
+
 def upgrade():
+    # Fail fast instead of queueing behind long-held locks and wedging the deploy
+    op.execute("SET lock_timeout = '5s'")
+    op.execute("SET statement_timeout = '30min'")
+    
     # Fix room_images table schema using raw SQL
     op.execute("""
         ALTER TABLE room_images 
         ADD COLUMN image_filename VARCHAR(255)
     """)
     
-    # Copy data from url to image_filename (extract filename from url)
-    op.execute("""
-        UPDATE room_images 
-        SET image_filename = SUBSTRING(url FROM '[^/]+$') 
-        WHERE url IS NOT NULL
-    """)
+    # Copy data from url to image_filename (last path segment of url).
+    # split_part on the reversed string avoids a per-row regex, and the
+    # id-range batches each commit on their own so writers are never
+    # blocked behind a single full-table UPDATE.
+    max_id = op.get_bind().execute(sa.text("SELECT MAX(id) FROM room_images")).scalar() or 0
+    with op.get_context().autocommit_block():
+        for lo in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            op.execute(sa.text("""
+                UPDATE room_images 
+                SET image_filename = reverse(split_part(reverse(url), '/', 1)) 
+                WHERE id >= :lo AND id < :hi AND url IS NOT NULL
+            """).bindparams(lo=lo, hi=lo + BACKFILL_BATCH_SIZE))
     
     # Make image_filename not nullable after data migration
     op.execute("""
@@ -42,6 +55,9 @@ def upgrade():
         DROP COLUMN url
     """)
 
+    op.execute("RESET lock_timeout")
+    op.execute("RESET statement_timeout")
+
 
 def downgrade():
     # Revert the changes using raw SQL
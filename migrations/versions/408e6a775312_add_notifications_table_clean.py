@@ -34,7 +34,9 @@ def upgrade():
         sa.Column('read_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['hotel_id'], ['hotels.id'], ),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        # Unread-inbox lookups filter on both columns
+        sa.Index('ix_notifications_user_is_read', 'user_id', 'is_read')
     )
 
 
@@ -16,27 +16,55 @@ branch_labels = None
 depends_on = None
 
 
+BACKFILL_BATCH_SIZE = 5000
+
+
 def upgrade():
+    # Fail fast instead of queueing behind long-held locks and wedging the deploy
+    op.execute("SET lock_timeout = '5s'")
+    op.execute("SET statement_timeout = '30min'")
+    
     # Add missing columns to invoices table
     with op.batch_alter_table("invoices", schema=None) as batch_op:
         batch_op.add_column(sa.Column("invoice_number", sa.String(50), nullable=True))
         batch_op.add_column(sa.Column("due_date", sa.Date(), nullable=True))
     
-    # Generate invoice numbers for existing records
-    op.execute("""
-        UPDATE invoices 
-        SET invoice_number = 'INV-' || LPAD(id::text, 6, '0')
-        WHERE invoice_number IS NULL
-    """)
+    # Generate invoice numbers for existing records in id-range batches,
+    # committing each batch so row locks and WAL stay bounded
+    max_id = op.get_bind().execute(sa.text("SELECT MAX(id) FROM invoices")).scalar() or 0
+    with op.get_context().autocommit_block():
+        for lo in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            op.execute(sa.text("""
+                UPDATE invoices 
+                SET invoice_number = 'INV-' || LPAD(id::text, 6, '0')
+                WHERE id >= :lo AND id < :hi AND invoice_number IS NULL
+            """).bindparams(lo=lo, hi=lo + BACKFILL_BATCH_SIZE))
     
-    # Make invoice_number unique and not nullable
-    batch_op.alter_column("invoice_number", nullable=False)
-    batch_op.create_unique_constraint("uq_invoice_number", ["invoice_number"])
+    # Make invoice_number not nullable without scanning under an exclusive
+    # lock: the CHECK is added NOT VALID and committed, then validated in its
+    # own transaction so writes keep flowing. SET NOT NULL (PostgreSQL 12+)
+    # trusts the validated CHECK instead of rescanning, and then replaces it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE invoices ADD CONSTRAINT ck_invoices_invoice_number_not_null "
+                   "CHECK (invoice_number IS NOT NULL) NOT VALID")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE invoices VALIDATE CONSTRAINT ck_invoices_invoice_number_not_null")
+    op.alter_column("invoices", "invoice_number", existing_type=sa.String(50), nullable=False)
+    op.execute("ALTER TABLE invoices DROP CONSTRAINT ck_invoices_invoice_number_not_null")
+
+    # Make invoice_number unique; the index is built concurrently so writes
+    # to invoices keep flowing
+    with op.get_context().autocommit_block():
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_invoice_number ON invoices (invoice_number)")
+
+    op.execute("RESET lock_timeout")
+    op.execute("RESET statement_timeout")
 
 
 def downgrade():
-    # Remove the added columns and constraint
+    # Remove the added columns and unique index
+    op.execute("DROP INDEX IF EXISTS uq_invoice_number")
+    op.execute("ALTER TABLE invoices DROP CONSTRAINT IF EXISTS ck_invoices_invoice_number_not_null")
     with op.batch_alter_table("invoices", schema=None) as batch_op:
-        batch_op.drop_constraint("uq_invoice_number", type_="unique")
         batch_op.drop_column("invoice_number")
         batch_op.drop_column("due_date")
@@ -0,0 +1,45 @@
+"""compute restaurant_orders.balance_due in the database
+
+Revision ID: a3c4d5e6f7a8
+Revises: f2b3c4d5e6f7
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c4d5e6f7a8'
+down_revision = 'f2b3c4d5e6f7'
+branch_labels = None
+depends_on = None
+
+
+BALANCE = (
+    "COALESCE(total_cents, 0) - COALESCE(discount_amount_cents, 0)"
+    " + COALESCE(tip_amount_cents, 0) - COALESCE(paid_amount_cents, 0)"
+)
+BALANCE_DUE_SQL = f"CASE WHEN {BALANCE} > 0 THEN {BALANCE} ELSE 0 END"
+
+
+def upgrade():
+    # Replace the app-maintained column with a stored generated column
+    with op.batch_alter_table('restaurant_orders', schema=None) as batch_op:
+        batch_op.drop_column('balance_due_cents')
+
+    with op.batch_alter_table('restaurant_orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column(
+            'balance_due_cents', sa.BigInteger(),
+            sa.Computed(BALANCE_DUE_SQL, persisted=True),
+        ))
+
+
+def downgrade():
+    with op.batch_alter_table('restaurant_orders', schema=None) as batch_op:
+        batch_op.drop_column('balance_due_cents')
+
+    with op.batch_alter_table('restaurant_orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('balance_due_cents', sa.BigInteger(), nullable=True))
+
+    op.execute(f"UPDATE restaurant_orders SET balance_due_cents = {BALANCE_DUE_SQL}")
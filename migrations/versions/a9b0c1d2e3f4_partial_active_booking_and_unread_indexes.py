@@ -0,0 +1,47 @@
+"""partial indexes for active bookings and unread notifications
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9b0c1d2e3f4'
+down_revision = 'f8a9b0c1d2e3'
+branch_labels = None
+depends_on = None
+
+
+# The single-column status and is_read indexes from add_performance_indexes are
+# already dropped by 9cd8334fbff6; these partial indexes cover only the rows the
+# availability, arrival and unread-inbox queries actually read.
+INDEXES = (
+    ('ix_bookings_active', 'bookings', "hotel_id, check_in_date",
+     "status IN ('Reserved', 'CheckedIn')", "status IN ('Reserved', 'CheckedIn')"),
+    ('ix_notifications_unread', 'notifications', "user_id, created_at DESC",
+     "is_read = false", "is_read = 0"),
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Built concurrently so writes to bookings and notifications keep flowing
+        with op.get_context().autocommit_block():
+            for name, table, columns, pg_where, _ in INDEXES:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns}) WHERE {pg_where}"
+                )
+    else:
+        for name, table, columns, _, sqlite_where in INDEXES:
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns}) WHERE {sqlite_where}")
+
+
+def downgrade():
+    concurrently = 'CONCURRENTLY ' if op.get_bind().dialect.name == 'postgresql' else ''
+    with op.get_context().autocommit_block():
+        for name, _, _, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX {concurrently}IF EXISTS {name}")
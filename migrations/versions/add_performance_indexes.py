@@ -15,31 +15,43 @@ branch_labels = None
 depends_on = None
 
 
+def _create_index(name, table, columns, unique=False):
+    """Create an index if it is missing; on PostgreSQL build it CONCURRENTLY so writes are not blocked."""
+    concurrently = 'CONCURRENTLY ' if op.get_bind().dialect.name == 'postgresql' else ''
+    # Each statement commits on its own, so one failure cannot abort the rest
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {concurrently}IF NOT EXISTS "
+            f"{name} ON {table} ({', '.join(columns)})"
+        )
+
+
+def _drop_index(name, table):
+    """Drop an index if it exists; on PostgreSQL drop it CONCURRENTLY."""
+    concurrently = 'CONCURRENTLY ' if op.get_bind().dialect.name == 'postgresql' else ''
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX {concurrently}IF EXISTS {name}")
+
+
 def upgrade():
     # ============================================
     # USERS & AUTHENTICATION
     # ============================================
     
     # Email lookups (login, user search)
-    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    _create_index('ix_users_email', 'users', ['email'], unique=True)
     
     # Hotel-based user lookups
-    op.create_index('ix_users_hotel_id', 'users', ['hotel_id'])
+    _create_index('ix_users_hotel_id', 'users', ['hotel_id'])
     
     # Role-based access control
-    op.create_index('ix_users_role', 'users', ['role'])
+    _create_index('ix_users_role', 'users', ['role'])
     
     # Password reset tokens
-    try:
-        op.create_index('ix_users_reset_token', 'users', ['reset_token'])
-    except:
-        pass
+    _create_index('ix_users_reset_token', 'users', ['reset_token'])
     
     # Last login for activity tracking
-    try:
-        op.create_index('ix_users_last_login_at', 'users', ['last_login_at'])
-    except:
-        pass
+    _create_index('ix_users_last_login_at', 'users', ['last_login_at'])
 
 
     # ============================================
@@ -47,10 +59,10 @@ def upgrade():
     # ============================================
     
     # Owner's hotels lookup
-    op.create_index('ix_hotels_owner_id', 'hotels', ['owner_id'])
+    _create_index('ix_hotels_owner_id', 'hotels', ['owner_id'])
     
     # Hotel name search
-    op.create_index('ix_hotels_name', 'hotels', ['name'])
+    _create_index('ix_hotels_name', 'hotels', ['name'])
 
 
     # ============================================
@@ -58,30 +70,30 @@ def upgrade():
     # ============================================
     
     # Guest bookings lookup
-    op.create_index('ix_bookings_guest_id', 'bookings', ['guest_id'])
+    _create_index('ix_bookings_guest_id', 'bookings', ['guest_id'])
     
     # Room bookings lookup (availability check)
-    op.create_index('ix_bookings_room_id', 'bookings', ['room_id'])
+    _create_index('ix_bookings_room_id', 'bookings', ['room_id'])
     
     # Date range queries (availability, calendar)
-    op.create_index('ix_bookings_check_in', 'bookings', ['check_in_date'])
-    op.create_index('ix_bookings_check_out', 'bookings', ['check_out_date'])
+    _create_index('ix_bookings_check_in', 'bookings', ['check_in_date'])
+    _create_index('ix_bookings_check_out', 'bookings', ['check_out_date'])
     
     # Composite index for availability checks
-    op.create_index('ix_bookings_room_dates', 'bookings', 
-                    ['room_id', 'check_in_date', 'check_out_date'])
+    _create_index('ix_bookings_room_dates', 'bookings', 
+                  ['room_id', 'check_in_date', 'check_out_date'])
     
     # Status filtering (active bookings, check-ins)
-    op.create_index('ix_bookings_status', 'bookings', ['status'])
+    _create_index('ix_bookings_status', 'bookings', ['status'])
     
     # Hotel bookings
-    op.create_index('ix_bookings_hotel_id', 'bookings', ['hotel_id'])
+    _create_index('ix_bookings_hotel_id', 'bookings', ['hotel_id'])
     
     # Booking reference lookup
-    op.create_index('ix_bookings_reference', 'bookings', ['booking_reference'])
+    _create_index('ix_bookings_reference', 'bookings', ['booking_reference'])
     
     # Recent bookings
-    op.create_index('ix_bookings_created_at', 'bookings', ['created_at'])
+    _create_index('ix_bookings_created_at', 'bookings', ['created_at'])
 
 
     # ============================================
@@ -89,16 +101,16 @@ def upgrade():
     # ============================================
     
     # Guest search by name
-    op.create_index('ix_guests_name', 'guests', ['name'])
+    _create_index('ix_guests_name', 'guests', ['name'])
     
     # Guest search by phone
-    op.create_index('ix_guests_phone', 'guests', ['phone'])
+    _create_index('ix_guests_phone', 'guests', ['phone'])
     
     # Guest search by email
-    op.create_index('ix_guests_email', 'guests', ['email'])
+    _create_index('ix_guests_email', 'guests', ['email'])
     
     # Hotel guests
-    op.create_index('ix_guests_hotel_id', 'guests', ['hotel_id'])
+    _create_index('ix_guests_hotel_id', 'guests', ['hotel_id'])
 
 
     # ============================================
@@ -106,22 +118,22 @@ def upgrade():
     # ============================================
     
     # Room type's rooms
-    op.create_index('ix_rooms_room_type_id', 'rooms', ['room_type_id'])
+    _create_index('ix_rooms_room_type_id', 'rooms', ['room_type_id'])
     
     # Room number lookup
-    op.create_index('ix_rooms_room_number', 'rooms', ['room_number'])
+    _create_index('ix_rooms_room_number', 'rooms', ['room_number'])
     
     # Status filtering (housekeeping, availability)
-    op.create_index('ix_rooms_status', 'rooms', ['status'])
+    _create_index('ix_rooms_status', 'rooms', ['status'])
     
     # Hotel rooms
-    op.create_index('ix_rooms_hotel_id', 'rooms', ['hotel_id'])
+    _create_index('ix_rooms_hotel_id', 'rooms', ['hotel_id'])
     
     # Room type hotel lookup
-    op.create_index('ix_room_types_hotel_id', 'room_types', ['hotel_id'])
+    _create_index('ix_room_types_hotel_id', 'room_types', ['hotel_id'])
     
     # Room type name search
-    op.create_index('ix_room_types_name', 'room_types', ['name'])
+    _create_index('ix_room_types_name', 'room_types', ['name'])
 
 
     # ============================================
@@ -129,16 +141,16 @@ def upgrade():
     # ============================================
     
     # Invoice booking lookup
-    op.create_index('ix_invoices_booking_id', 'invoices', ['booking_id'])
+    _create_index('ix_invoices_booking_id', 'invoices', ['booking_id'])
     
     # Invoice status filtering
-    op.create_index('ix_invoices_status', 'invoices', ['status'])
+    _create_index('ix_invoices_status', 'invoices', ['status'])
     
     # Payment invoice lookup
-    op.create_index('ix_payments_invoice_id', 'payments', ['invoice_id'])
+    _create_index('ix_payments_invoice_id', 'payments', ['invoice_id'])
     
     # Payment date range queries
-    op.create_index('ix_payments_created_at', 'payments', ['created_at'])
+    _create_index('ix_payments_created_at', 'payments', ['created_at'])
 
 
     # ============================================
@@ -146,28 +158,28 @@ def upgrade():
     # ============================================
     
     # Menu items by category
-    op.create_index('ix_menu_items_category_id', 'menu_items', ['category_id'])
+    _create_index('ix_menu_items_category_id', 'menu_items', ['category_id'])
     
     # Available menu items
-    op.create_index('ix_menu_items_is_available', 'menu_items', ['is_available'])
+    _create_index('ix_menu_items_is_available', 'menu_items', ['is_available'])
     
     # Menu items by hotel
-    op.create_index('ix_menu_items_hotel_id', 'menu_items', ['hotel_id'])
+    _create_index('ix_menu_items_hotel_id', 'menu_items', ['hotel_id'])
     
     # Menu categories by hotel
-    op.create_index('ix_menu_categories_hotel_id', 'menu_categories', ['hotel_id'])
+    _create_index('ix_menu_categories_hotel_id', 'menu_categories', ['hotel_id'])
     
     # Restaurant orders by table
-    op.create_index('ix_restaurant_orders_table_id', 'restaurant_orders', ['table_id'])
+    _create_index('ix_restaurant_orders_table_id', 'restaurant_orders', ['table_id'])
     
     # Order status (kitchen display)
-    op.create_index('ix_restaurant_orders_status', 'restaurant_orders', ['status'])
+    _create_index('ix_restaurant_orders_status', 'restaurant_orders', ['status'])
     
     # Order items lookup
-    op.create_index('ix_restaurant_order_items_order_id', 'restaurant_order_items', ['order_id'])
+    _create_index('ix_restaurant_order_items_order_id', 'restaurant_order_items', ['order_id'])
     
     # Restaurant tables by hotel
-    op.create_index('ix_restaurant_tables_hotel_id', 'restaurant_tables', ['hotel_id'])
+    _create_index('ix_restaurant_tables_hotel_id', 'restaurant_tables', ['hotel_id'])
 
 
     # ============================================
@@ -175,22 +187,22 @@ def upgrade():
     # ============================================
     
     # Journal entries by date
-    op.create_index('ix_journal_entries_date', 'journal_entries', ['date'])
+    _create_index('ix_journal_entries_date', 'journal_entries', ['date'])
     
     # Journal entries by hotel
-    op.create_index('ix_journal_entries_hotel_id', 'journal_entries', ['hotel_id'])
+    _create_index('ix_journal_entries_hotel_id', 'journal_entries', ['hotel_id'])
     
     # Journal lines by entry
-    op.create_index('ix_journal_lines_entry_id', 'journal_lines', ['journal_entry_id'])
+    _create_index('ix_journal_lines_entry_id', 'journal_lines', ['journal_entry_id'])
     
     # Journal lines by account
-    op.create_index('ix_journal_lines_account_id', 'journal_lines', ['account_id'])
+    _create_index('ix_journal_lines_account_id', 'journal_lines', ['account_id'])
     
     # Chart of accounts by hotel
-    op.create_index('ix_chart_of_accounts_hotel_id', 'chart_of_accounts', ['hotel_id'])
+    _create_index('ix_chart_of_accounts_hotel_id', 'chart_of_accounts', ['hotel_id'])
     
     # Account type filtering
-    op.create_index('ix_chart_of_accounts_type', 'chart_of_accounts', ['type'])
+    _create_index('ix_chart_of_accounts_type', 'chart_of_accounts', ['type'])
 
 
     # ============================================
@@ -198,85 +210,79 @@ def upgrade():
     # ============================================
     
     # User notifications
-    op.create_index('ix_notifications_user_id', 'notifications', ['user_id'])
+    _create_index('ix_notifications_user_id', 'notifications', ['user_id'])
     
     # Unread notifications
-    op.create_index('ix_notifications_is_read', 'notifications', ['is_read'])
+    _create_index('ix_notifications_is_read', 'notifications', ['is_read'])
     
     # Recent notifications
-    op.create_index('ix_notifications_created_at', 'notifications', ['created_at'])
+    _create_index('ix_notifications_created_at', 'notifications', ['created_at'])
 
 
 def downgrade():
     # Drop all indexes in reverse order
     
     # Notifications
-    op.drop_index('ix_notifications_created_at', 'notifications')
-    op.drop_index('ix_notifications_is_read', 'notifications')
-    op.drop_index('ix_notifications_user_id', 'notifications')
+    _drop_index('ix_notifications_created_at', 'notifications')
+    _drop_index('ix_notifications_is_read', 'notifications')
+    _drop_index('ix_notifications_user_id', 'notifications')
     
     # Accounting
-    op.drop_index('ix_chart_of_accounts_type', 'chart_of_accounts')
-    op.drop_index('ix_chart_of_accounts_hotel_id', 'chart_of_accounts')
-    op.drop_index('ix_journal_lines_account_id', 'journal_lines')
-    op.drop_index('ix_journal_lines_entry_id', 'journal_lines')
-    op.drop_index('ix_journal_entries_hotel_id', 'journal_entries')
-    op.drop_index('ix_journal_entries_date', 'journal_entries')
+    _drop_index('ix_chart_of_accounts_type', 'chart_of_accounts')
+    _drop_index('ix_chart_of_accounts_hotel_id', 'chart_of_accounts')
+    _drop_index('ix_journal_lines_account_id', 'journal_lines')
+    _drop_index('ix_journal_lines_entry_id', 'journal_lines')
+    _drop_index('ix_journal_entries_hotel_id', 'journal_entries')
+    _drop_index('ix_journal_entries_date', 'journal_entries')
     
     # Restaurant
-    op.drop_index('ix_restaurant_tables_hotel_id', 'restaurant_tables')
-    op.drop_index('ix_restaurant_order_items_order_id', 'restaurant_order_items')
-    op.drop_index('ix_restaurant_orders_status', 'restaurant_orders')
-    op.drop_index('ix_restaurant_orders_table_id', 'restaurant_orders')
-    op.drop_index('ix_menu_items_hotel_id', 'menu_items')
-    op.drop_index('ix_menu_items_is_available', 'menu_items')
-    op.drop_index('ix_menu_items_category_id', 'menu_items')
-    op.drop_index('ix_menu_categories_hotel_id', 'menu_categories')
+    _drop_index('ix_restaurant_tables_hotel_id', 'restaurant_tables')
+    _drop_index('ix_restaurant_order_items_order_id', 'restaurant_order_items')
+    _drop_index('ix_restaurant_orders_status', 'restaurant_orders')
+    _drop_index('ix_restaurant_orders_table_id', 'restaurant_orders')
+    _drop_index('ix_menu_items_hotel_id', 'menu_items')
+    _drop_index('ix_menu_items_is_available', 'menu_items')
+    _drop_index('ix_menu_items_category_id', 'menu_items')
+    _drop_index('ix_menu_categories_hotel_id', 'menu_categories')
     
     # Invoices & Payments
-    op.drop_index('ix_payments_created_at', 'payments')
-    op.drop_index('ix_payments_invoice_id', 'payments')
-    op.drop_index('ix_invoices_status', 'invoices')
-    op.drop_index('ix_invoices_booking_id', 'invoices')
+    _drop_index('ix_payments_created_at', 'payments')
+    _drop_index('ix_payments_invoice_id', 'payments')
+    _drop_index('ix_invoices_status', 'invoices')
+    _drop_index('ix_invoices_booking_id', 'invoices')
     
     # Rooms
-    op.drop_index('ix_room_types_name', 'room_types')
-    op.drop_index('ix_room_types_hotel_id', 'room_types')
-    op.drop_index('ix_rooms_hotel_id', 'rooms')
-    op.drop_index('ix_rooms_status', 'rooms')
-    op.drop_index('ix_rooms_room_number', 'rooms')
-    op.drop_index('ix_rooms_room_type_id', 'rooms')
+    _drop_index('ix_room_types_name', 'room_types')
+    _drop_index('ix_room_types_hotel_id', 'room_types')
+    _drop_index('ix_rooms_hotel_id', 'rooms')
+    _drop_index('ix_rooms_status', 'rooms')
+    _drop_index('ix_rooms_room_number', 'rooms')
+    _drop_index('ix_rooms_room_type_id', 'rooms')
     
     # Guests
-    op.drop_index('ix_guests_hotel_id', 'guests')
-    op.drop_index('ix_guests_email', 'guests')
-    op.drop_index('ix_guests_phone', 'guests')
-    op.drop_index('ix_guests_name', 'guests')
+    _drop_index('ix_guests_hotel_id', 'guests')
+    _drop_index('ix_guests_email', 'guests')
+    _drop_index('ix_guests_phone', 'guests')
+    _drop_index('ix_guests_name', 'guests')
     
     # Bookings
-    op.drop_index('ix_bookings_created_at', 'bookings')
-    op.drop_index('ix_bookings_reference', 'bookings')
-    op.drop_index('ix_bookings_hotel_id', 'bookings')
-    op.drop_index('ix_bookings_status', 'bookings')
-    op.drop_index('ix_bookings_room_dates', 'bookings')
-    op.drop_index('ix_bookings_check_out', 'bookings')
-    op.drop_index('ix_bookings_check_in', 'bookings')
-    op.drop_index('ix_bookings_room_id', 'bookings')
-    op.drop_index('ix_bookings_guest_id', 'bookings')
+    _drop_index('ix_bookings_created_at', 'bookings')
+    _drop_index('ix_bookings_reference', 'bookings')
+    _drop_index('ix_bookings_hotel_id', 'bookings')
+    _drop_index('ix_bookings_status', 'bookings')
+    _drop_index('ix_bookings_room_dates', 'bookings')
+    _drop_index('ix_bookings_check_out', 'bookings')
+    _drop_index('ix_bookings_check_in', 'bookings')
+    _drop_index('ix_bookings_room_id', 'bookings')
+    _drop_index('ix_bookings_guest_id', 'bookings')
     
     # Hotels
-    op.drop_index('ix_hotels_name', 'hotels')
-    op.drop_index('ix_hotels_owner_id', 'hotels')
+    _drop_index('ix_hotels_name', 'hotels')
+    _drop_index('ix_hotels_owner_id', 'hotels')
     
     # Users
-    try:
-        op.drop_index('ix_users_last_login_at', 'users')
-    except:
-        pass
-    try:
-        op.drop_index('ix_users_reset_token', 'users')
-    except:
-        pass
-    op.drop_index('ix_users_role', 'users')
-    op.drop_index('ix_users_hotel_id', 'users')
-    op.drop_index('ix_users_email', 'users')
+    _drop_index('ix_users_last_login_at', 'users')
+    _drop_index('ix_users_reset_token', 'users')
+    _drop_index('ix_users_role', 'users')
+    _drop_index('ix_users_hotel_id', 'users')
+    _drop_index('ix_users_email', 'users')
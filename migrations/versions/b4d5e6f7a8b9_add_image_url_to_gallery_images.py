@@ -0,0 +1,32 @@
+"""add image_url to gallery_images
+
+Revision ID: b4d5e6f7a8b9
+Revises: a3c4d5e6f7a8
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d5e6f7a8b9'
+down_revision = 'a3c4d5e6f7a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('gallery_images', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('image_url', sa.String(length=512), nullable=True))
+
+    # Backfill URLs for existing images
+    op.execute("""
+        UPDATE gallery_images
+        SET image_url = '/static/uploads/gallery/' || image_filename
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('gallery_images', schema=None) as batch_op:
+        batch_op.drop_column('image_url')
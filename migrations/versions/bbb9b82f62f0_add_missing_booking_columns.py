@@ -7,6 +7,7 @@ Create Date: 2026-02-18 11:23:20.735706
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.schema import CreateColumn
 
 
 # revision identifiers, used by Alembic.
@@ -16,38 +17,104 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade():
-    # Add only missing columns to bookings table
-    with op.batch_alter_table("bookings", schema=None) as batch_op:
+BACKFILL_BATCH_SIZE = 5000
+
+# Required columns and the defaults they get once populated
+REQUIRED_DEFAULTS = {
+    "guest_name": "",
+    "guest_email": "",
+    "guest_phone": "",
+    "amount_paid": "0",
+    "balance": "0",
+}
+
+
+def _new_columns(enforce_required=True):
+    def required(name, type_):
+        if enforce_required:
+            return sa.Column(name, type_, nullable=False, server_default=REQUIRED_DEFAULTS[name])
+        return sa.Column(name, type_, nullable=True)
+
+    return [
         # Guest info columns (missing)
-        batch_op.add_column(sa.Column("guest_name", sa.String(255), nullable=False))
-        batch_op.add_column(sa.Column("guest_email", sa.String(255), nullable=False))
-        batch_op.add_column(sa.Column("guest_phone", sa.String(50), nullable=False))
+        required("guest_name", sa.String(255)),
+        required("guest_email", sa.String(255)),
+        required("guest_phone", sa.String(50)),
         
         # Room assignment columns (missing room_type_requested)
-        batch_op.add_column(sa.Column("room_type_requested", sa.String(100), nullable=True))
+        sa.Column("room_type_requested", sa.String(100), nullable=True),
         
         # Date/time columns (missing)
-        batch_op.add_column(sa.Column("check_in_time_actual", sa.DateTime(), nullable=True))
-        batch_op.add_column(sa.Column("check_out_time_actual", sa.DateTime(), nullable=True))
+        sa.Column("check_in_time_actual", sa.DateTime(), nullable=True),
+        sa.Column("check_out_time_actual", sa.DateTime(), nullable=True),
         
         # Pricing columns (missing)
-        batch_op.add_column(sa.Column("amount_paid", sa.Numeric(12, 2), nullable=False))
-        batch_op.add_column(sa.Column("balance", sa.Numeric(12, 2), nullable=False))
+        required("amount_paid", sa.Numeric(12, 2)),
+        required("balance", sa.Numeric(12, 2)),
         
         # Requests and notes (missing)
-        batch_op.add_column(sa.Column("internal_notes", sa.Text(), nullable=True))
+        sa.Column("internal_notes", sa.Text(), nullable=True),
         
         # Website-specific fields (missing)
-        batch_op.add_column(sa.Column("ip_address", sa.String(45), nullable=True))
-        batch_op.add_column(sa.Column("user_agent", sa.String(500), nullable=True))
-        batch_op.add_column(sa.Column("referral_source", sa.String(255), nullable=True))
+        sa.Column("ip_address", sa.String(45), nullable=True),
+        sa.Column("user_agent", sa.String(500), nullable=True),
+        sa.Column("referral_source", sa.String(255), nullable=True),
         
         # Timestamp columns (missing)
-        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
-        batch_op.add_column(sa.Column("confirmed_at", sa.DateTime(), nullable=True))
-        batch_op.add_column(sa.Column("cancelled_at", sa.DateTime(), nullable=True))
-        batch_op.add_column(sa.Column("cancellation_reason", sa.Text(), nullable=True))
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("confirmed_at", sa.DateTime(), nullable=True),
+        sa.Column("cancelled_at", sa.DateTime(), nullable=True),
+        sa.Column("cancellation_reason", sa.Text(), nullable=True),
+    ]
+
+
+def upgrade():
+    # Add only missing columns to bookings table
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        with op.batch_alter_table("bookings", schema=None) as batch_op:
+            for column in _new_columns():
+                batch_op.add_column(column)
+        return
+
+    # Fail fast instead of queueing behind long-held locks and wedging the deploy
+    op.execute("SET lock_timeout = '5s'")
+    op.execute("SET statement_timeout = '30min'")
+
+    # Add every column nullable in one ALTER TABLE, so the exclusive lock is
+    # taken once and PostgreSQL does not scan the table for NOT NULL.
+    # The columns are bound to a throwaway Table so CreateColumn can render them.
+    columns = _new_columns(enforce_required=False)
+    sa.Table("bookings", sa.MetaData(), *columns)
+    op.execute("ALTER TABLE bookings " + ", ".join(
+        f"ADD COLUMN {CreateColumn(column).compile(dialect=bind.dialect)}"
+        for column in columns
+    ))
+
+    # Backfill the required columns from guests in committed id-range batches
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM bookings")).scalar() or 0
+    with op.get_context().autocommit_block():
+        for lo in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            op.execute(sa.text("""
+                UPDATE bookings 
+                SET guest_name = COALESCE(guests.name, ''),
+                    guest_email = COALESCE(guests.email, ''),
+                    guest_phone = COALESCE(guests.phone, ''),
+                    amount_paid = 0,
+                    balance = bookings.total_amount
+                FROM guests
+                WHERE guests.id = bookings.guest_id
+                  AND bookings.id >= :lo AND bookings.id < :hi
+            """).bindparams(lo=lo, hi=lo + BACKFILL_BATCH_SIZE))
+
+    # Defaults first, then NOT NULL once the data is present
+    op.execute("ALTER TABLE bookings " + ", ".join(
+        f"ALTER COLUMN {name} SET DEFAULT '{default}', ALTER COLUMN {name} SET NOT NULL"
+        for name, default in REQUIRED_DEFAULTS.items()
+    ))
+
+    op.execute("RESET lock_timeout")
+    op.execute("RESET statement_timeout")
 
 
 def downgrade():
@@ -7,6 +7,7 @@ Create Date: 2026-02-18 13:10:29.282992
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.schema import CreateColumn
 
 
 # revision identifiers, used by Alembic.
@@ -16,30 +17,75 @@ branch_labels = None
 depends_on = None
 
 
+BACKFILL_BATCH_SIZE = 10000
+DEFAULTS = {"payment_type": "full", "status": "completed"}
+
+
+def _new_columns(with_defaults=True):
+    def default(name):
+        return DEFAULTS[name] if with_defaults else None
+
+    return [
+        sa.Column("booking_id", sa.Integer(), nullable=True),
+        sa.Column("payment_type", sa.String(20), nullable=True, server_default=default("payment_type")),
+        sa.Column("transaction_id", sa.String(100), nullable=True),
+        sa.Column("status", sa.String(20), nullable=True, server_default=default("status")),
+        sa.Column("notes", sa.Text(), nullable=True),
+    ]
+
+
 def upgrade():
     # Add missing columns to payments table
-    with op.batch_alter_table("payments", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("booking_id", sa.Integer(), nullable=True))
-        batch_op.add_column(sa.Column("payment_type", sa.String(20), nullable=True, server_default='full'))
-        batch_op.add_column(sa.Column("transaction_id", sa.String(100), nullable=True))
-        batch_op.add_column(sa.Column("status", sa.String(20), nullable=True, server_default='completed'))
-        batch_op.add_column(sa.Column("notes", sa.Text(), nullable=True))
-    
-    # Add foreign key constraints
-    op.execute("""
-        ALTER TABLE payments 
-        ADD CONSTRAINT fk_payments_booking_id 
-        FOREIGN KEY (booking_id) REFERENCES bookings(id)
-    """)
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        with op.batch_alter_table("payments", schema=None) as batch_op:
+            for column in _new_columns():
+                batch_op.add_column(column)
+            batch_op.create_foreign_key("fk_payments_booking_id", "bookings", ["booking_id"], ["id"])
+        return
+
+    # One ALTER TABLE adds every column and the foreign key under a single lock.
+    # The columns are bound to a throwaway Table so CreateColumn can render them.
+    # They go in without defaults so no engine rewrites the table; existing
+    # rows are backfilled in id batches and the defaults are set afterwards.
+    # On PostgreSQL the key is added NOT VALID and validated separately, so
+    # the existing rows are checked without blocking writes to payments.
+    postgresql = bind.dialect.name == 'postgresql'
+    columns = _new_columns(with_defaults=False)
+    sa.Table("payments", sa.MetaData(), *columns)
+    op.execute("ALTER TABLE payments " + ", ".join(
+        [f"ADD COLUMN {CreateColumn(column).compile(dialect=bind.dialect)}" for column in columns]
+        + ["ADD CONSTRAINT fk_payments_booking_id FOREIGN KEY (booking_id) REFERENCES bookings(id)"
+           + (" NOT VALID" if postgresql else "")]
+    ))
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM payments")).scalar() or 0
+    # Commit the ADD first so its exclusive lock is released; each batch then commits on its own
+    with op.get_context().autocommit_block():
+        for lo in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            op.execute(sa.text(
+                "UPDATE payments SET payment_type = :payment_type, status = :status "
+                "WHERE id >= :lo AND id < :hi"
+            ).bindparams(lo=lo, hi=lo + BACKFILL_BATCH_SIZE, **DEFAULTS))
+        for name, value in DEFAULTS.items():
+            op.alter_column("payments", name, existing_type=sa.String(20), server_default=value)
+        if postgresql:
+            op.execute("ALTER TABLE payments VALIDATE CONSTRAINT fk_payments_booking_id")
 
 
 def downgrade():
     # Remove foreign key constraint and columns
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table("payments", schema=None) as batch_op:
+            batch_op.drop_constraint("fk_payments_booking_id", type_="foreignkey")
+            batch_op.drop_column("notes")
+            batch_op.drop_column("status")
+            batch_op.drop_column("transaction_id")
+            batch_op.drop_column("payment_type")
+            batch_op.drop_column("booking_id")
+        return
+
     op.execute("ALTER TABLE payments DROP CONSTRAINT IF EXISTS fk_payments_booking_id")
-    
-    with op.batch_alter_table("payments", schema=None) as batch_op:
-        batch_op.drop_column("notes")
-        batch_op.drop_column("status")
-        batch_op.drop_column("transaction_id")
-        batch_op.drop_column("payment_type")
-        batch_op.drop_column("booking_id")
+    op.execute(
+        "ALTER TABLE payments DROP COLUMN notes, DROP COLUMN status, "
+        "DROP COLUMN transaction_id, DROP COLUMN payment_type, DROP COLUMN booking_id"
+    )
@@ -7,6 +7,8 @@ Create Date: 2026-02-15
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateColumn
 
 
 revision = "c1f2a3b4c5d6"
@@ -15,20 +17,48 @@ branch_labels = None
 depends_on = None
 
 
+def _add_columns(table, columns):
+    """Add columns in one ALTER TABLE (one lock); SQLite goes through batch mode."""
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.add_column(column)
+        return
+    # Bind the columns to a throwaway Table so CreateColumn can render them
+    sa.Table(table, sa.MetaData(), *columns)
+    op.execute(f"ALTER TABLE {table} " + ", ".join(
+        f"ADD COLUMN {CreateColumn(column).compile(dialect=bind.dialect)}"
+        for column in columns
+    ))
+
+
+def _drop_columns(table, names):
+    """Drop columns in one ALTER TABLE; SQLite goes through batch mode."""
+    if op.get_bind().dialect.name == "sqlite":
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name in names:
+                batch_op.drop_column(name)
+        return
+    op.execute(f"ALTER TABLE {table} " + ", ".join(f"DROP COLUMN {name}" for name in names))
+
+
 def upgrade():
     # RoomType: description, short_description, capacity, size_sqm, bed_type, amenities, is_active
-    with op.batch_alter_table("room_types", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("description", sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column("short_description", sa.String(500), nullable=True))
-        batch_op.add_column(sa.Column("capacity", sa.Integer(), nullable=True))
-        batch_op.add_column(sa.Column("size_sqm", sa.String(20), nullable=True))
-        batch_op.add_column(sa.Column("bed_type", sa.String(100), nullable=True))
-        batch_op.add_column(sa.Column("amenities", sa.JSON(), nullable=True))
-        batch_op.add_column(sa.Column("is_active", sa.Boolean(), nullable=True))
+    _add_columns("room_types", [
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("short_description", sa.String(500), nullable=True),
+        sa.Column("capacity", sa.Integer(), nullable=True),
+        sa.Column("size_sqm", sa.String(20), nullable=True),
+        sa.Column("bed_type", sa.String(100), nullable=True),
+        sa.Column("amenities", sa.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+    ])
 
     # Room: is_active
-    with op.batch_alter_table("rooms", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("is_active", sa.Boolean(), nullable=True))
+    _add_columns("rooms", [
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+    ])
 
     # RoomImage
     op.create_table(
@@ -42,34 +72,31 @@ def upgrade():
         sa.ForeignKeyConstraint(["room_type_id"], ["room_types.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
     )
+    # Index the FK so cascades from room_types and per-type image lookups avoid a seq scan
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_room_images_room_type_id ON room_images (room_type_id)")
+    else:
+        op.create_index("ix_room_images_room_type_id", "room_images", ["room_type_id"])
 
     # Booking: adults, children, source, booking_reference, special_requests
-    with op.batch_alter_table("bookings", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("adults", sa.Integer(), nullable=True))
-        batch_op.add_column(sa.Column("children", sa.Integer(), nullable=True))
-        batch_op.add_column(sa.Column("source", sa.String(50), nullable=True))
-        batch_op.add_column(sa.Column("booking_reference", sa.String(50), nullable=True))
-        batch_op.add_column(sa.Column("special_requests", sa.Text(), nullable=True))
+    _add_columns("bookings", [
+        sa.Column("adults", sa.Integer(), nullable=True),
+        sa.Column("children", sa.Integer(), nullable=True),
+        sa.Column("source", sa.String(50), nullable=True),
+        sa.Column("booking_reference", sa.String(50), nullable=True),
+        sa.Column("special_requests", sa.Text(), nullable=True),
+    ])
 
 
 def downgrade():
-    with op.batch_alter_table("bookings", schema=None) as batch_op:
-        batch_op.drop_column("special_requests")
-        batch_op.drop_column("booking_reference")
-        batch_op.drop_column("source")
-        batch_op.drop_column("children")
-        batch_op.drop_column("adults")
+    _drop_columns("bookings", ["special_requests", "booking_reference", "source", "children", "adults"])
 
+    op.drop_index("ix_room_images_room_type_id", table_name="room_images")
     op.drop_table("room_images")
 
-    with op.batch_alter_table("rooms", schema=None) as batch_op:
-        batch_op.drop_column("is_active")
-
-    with op.batch_alter_table("room_types", schema=None) as batch_op:
-        batch_op.drop_column("is_active")
-        batch_op.drop_column("amenities")
-        batch_op.drop_column("bed_type")
-        batch_op.drop_column("size_sqm")
-        batch_op.drop_column("capacity")
-        batch_op.drop_column("short_description")
-        batch_op.drop_column("description")
+    _drop_columns("rooms", ["is_active"])
+
+    _drop_columns("room_types", [
+        "is_active", "amenities", "bed_type", "size_sqm", "capacity", "short_description", "description",
+    ])
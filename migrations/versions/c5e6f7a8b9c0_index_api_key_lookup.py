@@ -0,0 +1,33 @@
+"""index api_keys prefix lookup and make key_hash unique
+
+Revision ID: c5e6f7a8b9c0
+Revises: b4d5e6f7a8b9
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e6f7a8b9c0'
+down_revision = 'b4d5e6f7a8b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial index: inactive keys never take part in auth lookups
+    op.create_index(
+        'ix_api_keys_prefix_active', 'api_keys', ['key_prefix', 'active'],
+        postgresql_where=sa.text('active = true'),
+        sqlite_where=sa.text('active = 1'),
+    )
+    with op.batch_alter_table('api_keys', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_api_keys_key_hash', ['key_hash'])
+
+
+def downgrade():
+    with op.batch_alter_table('api_keys', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_api_keys_key_hash', type_='unique')
+    op.drop_index('ix_api_keys_prefix_active', table_name='api_keys')
@@ -17,12 +17,22 @@ depends_on = None
 
 
 def upgrade():
-    # Add due_date column to invoices table
-    with op.batch_alter_table("invoices", schema=None) as batch_op:
-        batch_op.add_column(sa.Column("due_date", sa.Date(), nullable=True))
+    # Add due_date column to invoices table; 409e3662124e already adds it on
+    # a linear upgrade, so only add it when it is missing
+    bind = op.get_bind()
+    if "due_date" in {col["name"] for col in sa.inspect(bind).get_columns("invoices")}:
+        return
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("invoices", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("due_date", sa.Date(), nullable=True))
+    else:
+        op.add_column("invoices", sa.Column("due_date", sa.Date(), nullable=True))
 
 
 def downgrade():
     # Remove due_date column from invoices table
-    with op.batch_alter_table("invoices", schema=None) as batch_op:
-        batch_op.drop_column("due_date")
+    if op.get_bind().dialect.name == "sqlite":
+        with op.batch_alter_table("invoices", schema=None) as batch_op:
+            batch_op.drop_column("due_date")
+    else:
+        op.drop_column("invoices", "due_date")
@@ -0,0 +1,38 @@
+"""store room_types.amenities as jsonb on PostgreSQL
+
+Revision ID: d6f7a8b9c0d1
+Revises: c5e6f7a8b9c0
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd6f7a8b9c0d1'
+down_revision = 'c5e6f7a8b9c0'
+branch_labels = None
+depends_on = None
+
+
+def _amenities_type(bind):
+    return bind.execute(sa.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'room_types' AND column_name = 'amenities'"
+    )).scalar()
+
+
+def upgrade():
+    # Databases created before c1f2a3b4c5d6 switched to JSONB still hold textual json
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or _amenities_type(bind) != 'json':
+        return
+    op.execute('ALTER TABLE room_types ALTER COLUMN amenities TYPE jsonb USING amenities::jsonb')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or _amenities_type(bind) != 'jsonb':
+        return
+    op.execute('ALTER TABLE room_types ALTER COLUMN amenities TYPE json USING amenities::json')
@@ -0,0 +1,72 @@
+"""server-side created_at defaults for restaurant and notification tables
+
+Revision ID: e1a2b3c4d5e6
+Revises: 0d3f50f53fbe
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a2b3c4d5e6'
+down_revision = '0d3f50f53fbe'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'notifications',
+    'room_service_orders',
+    'room_service_order_items',
+    'menu_categories',
+    'menu_items',
+    'menu_item_inventory',
+    'restaurant_tables',
+    'restaurant_orders',
+    'restaurant_order_items',
+    'order_modifiers',
+    'table_reservations',
+)
+
+
+def _existing_tables():
+    # order_modifiers / table_reservations are only created by db.create_all()
+    return set(inspect(op.get_bind()).get_table_names())
+
+
+def _utcnow_sql():
+    # Same expressions as the utcnow construct in app.models; SQLite's
+    # CURRENT_TIMESTAMP is already UTC and it has no timezone() function
+    if op.get_bind().dialect.name == 'postgresql':
+        return "timezone('utc', now())"
+    return "CURRENT_TIMESTAMP"
+
+
+def upgrade():
+    # Let the database stamp created_at on insert, as naive UTC like the
+    # datetime.utcnow default it replaces
+    existing = _existing_tables()
+    utcnow_sql = _utcnow_sql()
+    for table in TABLES:
+        if table not in existing:
+            continue
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at',
+                   existing_type=sa.DateTime(),
+                   server_default=sa.text(utcnow_sql),
+                   existing_nullable=True)
+
+
+def downgrade():
+    existing = _existing_tables()
+    for table in reversed(TABLES):
+        if table not in existing:
+            continue
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at',
+                   existing_type=sa.DateTime(),
+                   server_default=None,
+                   existing_nullable=True)
@@ -0,0 +1,72 @@
+"""unique live inventory category and supplier names per hotel
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6f7a8b9c0d1
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7f8a9b0c1d2'
+down_revision = 'd6f7a8b9c0d1'
+branch_labels = None
+depends_on = None
+
+
+# The routes already refuse duplicate names among rows that are not soft-deleted;
+# these partial indexes enforce the same rule and give seeds an ON CONFLICT target.
+INDEXES = (
+    ('uq_inventory_categories_hotel_name', 'inventory_categories'),
+    ('uq_suppliers_hotel_name', 'suppliers'),
+)
+
+
+def _check_no_duplicates(bind):
+    # A failed concurrent build leaves an INVALID index behind, so refuse up
+    # front and say which names need merging or soft-deleting first
+    problems = []
+    for _, table in INDEXES:
+        rows = bind.execute(sa.text(
+            f'SELECT hotel_id, name, COUNT(*) FROM {table} WHERE deleted_at IS NULL '
+            f'GROUP BY hotel_id, name HAVING COUNT(*) > 1 ORDER BY hotel_id, name LIMIT 20'
+        )).fetchall()
+        problems.extend(f'{table}: hotel {hotel_id} has {count} live rows named {name!r}'
+                        for hotel_id, name, count in rows)
+    if problems:
+        raise RuntimeError(
+            'Duplicate live names must be resolved before adding the unique indexes:\n  '
+            + '\n  '.join(problems)
+        )
+
+
+def upgrade():
+    bind = op.get_bind()
+    _check_no_duplicates(bind)
+    if bind.dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table in INDEXES:
+                # IF NOT EXISTS would keep an INVALID index from an interrupted build
+                invalid = bind.execute(sa.text(
+                    'SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+                    'WHERE c.relname = :name AND NOT i.indisvalid'
+                ), {'name': name}).scalar()
+                if invalid:
+                    op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+                op.execute(
+                    f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} '
+                    f'ON {table} (hotel_id, name) WHERE deleted_at IS NULL'
+                )
+        return
+    for name, table in INDEXES:
+        op.create_index(
+            name, table, ['hotel_id', 'name'], unique=True,
+            sqlite_where=sa.text('deleted_at IS NULL'),
+        )
+
+
+def downgrade():
+    for name, table in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,58 @@
+"""store restaurant and room service order amounts as integer cents
+
+Revision ID: f2b3c4d5e6f7
+Revises: e1a2b3c4d5e6
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b3c4d5e6f7'
+down_revision = 'e1a2b3c4d5e6'
+branch_labels = None
+depends_on = None
+
+
+MONEY_COLUMNS = {
+    'restaurant_orders': (
+        'subtotal', 'tax', 'total',
+        'paid_amount', 'discount_amount', 'tip_amount', 'balance_due',
+    ),
+    'room_service_orders': ('subtotal', 'tax', 'total'),
+}
+
+
+def upgrade():
+    for table, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.add_column(sa.Column(f'{column}_cents', sa.BigInteger(), nullable=True))
+
+        # Copy existing amounts across as cents
+        assignments = ', '.join(
+            f'{column}_cents = CAST(ROUND({column} * 100) AS BIGINT)' for column in columns
+        )
+        op.execute(f'UPDATE {table} SET {assignments}')
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.drop_column(column)
+
+
+def downgrade():
+    for table, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.add_column(sa.Column(column, sa.Numeric(precision=10, scale=2), nullable=True))
+
+        assignments = ', '.join(
+            f'{column} = {column}_cents / 100.0' for column in columns
+        )
+        op.execute(f'UPDATE {table} SET {assignments}')
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.drop_column(f'{column}_cents')
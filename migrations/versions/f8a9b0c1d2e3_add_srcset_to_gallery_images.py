@@ -0,0 +1,27 @@
+"""add srcset to gallery_images
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8a9b0c1d2e3'
+down_revision = 'e7f8a9b0c1d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled by the image worker after upload; existing images render without srcset
+    with op.batch_alter_table('gallery_images', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('srcset', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('gallery_images', schema=None) as batch_op:
+        batch_op.drop_column('srcset')
@@ -1,7 +1,6 @@
 import os
 from dotenv import load_dotenv
-from app import create_app, db
-from app.models import Owner, Hotel, User, Room, RoomType, Booking, Guest, Invoice, Payment
+from app import create_app
 
 load_dotenv()
 
@@ -12,11 +11,15 @@ if __name__ == '__main__':
     host = os.environ.get('FLASK_HOST', '0.0.0.0')
     port = int(os.environ.get('PORT', 5000))
     
-    # In production, use gunicorn instead:
-    # gunicorn -w 4 -b 0.0.0.0:8000 run:app
+    env = os.environ.get('FLASK_ENV', 'production')
     
-    print(f"Starting Flask app on {host}:{port}")
-    print(f"Debug mode: {debug}")
-    print(f"Environment: {os.environ.get('FLASK_ENV', 'production')}")
+    print(f"Starting Flask app on {host}:{port}\nDebug mode: {debug}\nEnvironment: {env}", flush=True)
+    
+    # The Werkzeug dev server handles one request at a time. Production runs
+    # gunicorn against wsgi:app (see deploy/hms.service); RUN_GUNICORN=true
+    # hands this process over to gunicorn instead (not available on Windows)
+    if os.environ.get('RUN_GUNICORN', 'False').lower() == 'true':
+        workers = os.environ.get('WEB_CONCURRENCY', '4')
+        os.execvp('gunicorn', ['gunicorn', '-w', workers, '-b', f'{host}:{port}', 'run:app'])
     
     app.run(host=host, port=port, debug=debug)
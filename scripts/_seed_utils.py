@@ -0,0 +1,5 @@
+"""Helpers shared by the seed scripts."""
+
+# Seeded demo passwords are published in the seed scripts, so a full-strength
+# PBKDF2 work factor only slows seeding down
+DEMO_HASH_METHOD = "pbkdf2:sha256:1000"
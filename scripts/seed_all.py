@@ -0,0 +1,24 @@
+"""Run every seed script against one app instance. Run: python -m scripts.seed_all"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("FLASK_APP", "app")
+
+from app import create_app
+from scripts import seed_superadmin, seed_demo, seed_inventory, seed_staff_roles, seed_ngenda_hotel
+
+# Order matters: inventory and staff seeds attach to the demo hotel
+SEEDERS = (seed_superadmin, seed_demo, seed_inventory, seed_staff_roles, seed_ngenda_hotel)
+
+
+def main():
+    # Build the app once instead of once per script
+    app = create_app()
+    for seeder in SEEDERS:
+        print(f"--- {seeder.__name__} ---")
+        seeder.main(app=app)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,13 @@ os.environ.setdefault("FLASK_APP", "app")
 
 from app import create_app
 from app.extensions import db
-from app.models.owner import Owner
-from app.models.hotel import Hotel
-from app.models.user import User
+from app.models import Owner, Hotel, User
 from werkzeug.security import generate_password_hash
+from scripts._seed_utils import DEMO_HASH_METHOD
 
-def main():
-    app = create_app()
+
+def main(app=None):
+    app = app or create_app()
     with app.app_context():
         owner = Owner.query.filter_by(email="owner@demo.com").first()
         if not owner:
@@ -28,7 +28,7 @@ def main():
         if not manager:
             manager = User(
                 email="manager@demo.com",
-                password_hash=generate_password_hash("manager123"),
+                password_hash=generate_password_hash("manager123", method=DEMO_HASH_METHOD),
                 role="manager",
                 hotel_id=hotel.id,
                 owner_id=None,
@@ -5,14 +5,21 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault("FLASK_APP", "app")
 
+from sqlalchemy.dialects import postgresql, sqlite
+
 from app import create_app
 from app.extensions import db
-from app.models.hotel import Hotel
-from app.models.inventory import InventoryCategory, InventoryItem, Supplier
+from app.models import Hotel, InventoryCategory, Supplier
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 
-def main():
-    app = create_app()
+def main(app=None):
+    app = app or create_app()
     with app.app_context():
         hotel = Hotel.query.first()
         if not hotel:
@@ -26,18 +33,19 @@ def main():
             {"name": "Mini Bar", "description": "Drinks and snacks"},
             {"name": "Kitchen", "description": "Food and cooking supplies"},
         ]
-        for cat_data in categories_data:
-            existing = InventoryCategory.query.filter_by(
-                hotel_id=hotel.id, name=cat_data["name"]
-            ).first()
-            if not existing:
-                cat = InventoryCategory(
-                    hotel_id=hotel.id,
-                    name=cat_data["name"],
-                    description=cat_data["description"],
-                )
-                db.session.add(cat)
-        db.session.commit()
+        dialect = db.engine.dialect.name
+        if dialect not in ON_CONFLICT_INSERTS:
+            raise RuntimeError(f"seed_inventory supports PostgreSQL and SQLite, not {dialect}")
+        insert = ON_CONFLICT_INSERTS[dialect]
+        # The live-name unique index does the dedup, so reruns are one INSERT each
+        db.session.execute(
+            insert(InventoryCategory)
+            .values([{"hotel_id": hotel.id, **cat_data} for cat_data in categories_data])
+            .on_conflict_do_nothing(
+                index_elements=["hotel_id", "name"],
+                index_where=InventoryCategory.deleted_at.is_(None),
+            )
+        )
         print("Categories created")
 
         suppliers_data = [
@@ -60,19 +68,23 @@ def main():
                 "phone": "555-0103",
             },
         ]
-        for sup_data in suppliers_data:
-            existing = Supplier.query.filter_by(
-                hotel_id=hotel.id, name=sup_data["name"]
-            ).first()
-            if not existing:
-                supplier = Supplier(
-                    hotel_id=hotel.id,
-                    name=sup_data["name"],
-                    contact_person=sup_data["contact"],
-                    email=sup_data["email"],
-                    phone=sup_data["phone"],
-                )
-                db.session.add(supplier)
+        db.session.execute(
+            insert(Supplier)
+            .values([
+                {
+                    "hotel_id": hotel.id,
+                    "name": sup_data["name"],
+                    "contact_person": sup_data["contact"],
+                    "email": sup_data["email"],
+                    "phone": sup_data["phone"],
+                }
+                for sup_data in suppliers_data
+            ])
+            .on_conflict_do_nothing(
+                index_elements=["hotel_id", "name"],
+                index_where=Supplier.deleted_at.is_(None),
+            )
+        )
         db.session.commit()
         print("Suppliers created")
 
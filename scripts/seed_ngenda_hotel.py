@@ -4,17 +4,17 @@ Seed Ngenda Hotel & Apartments for website integration.
 Run from project root: python scripts/seed_ngenda_hotel.py
 Or: flask shell < scripts/seed_ngenda_hotel.py
 """
+import csv
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from sqlalchemy import insert
+
 from app import create_app
 from app.extensions import db
-from app.models.owner import Owner
-from app.models.hotel import Hotel
-from app.models.room import RoomType, Room, RoomImage
-
-app = create_app()
+from app.models import Owner, Hotel, RoomType, Room
 
 ROOMS_DATA = [
     {
@@ -64,73 +64,124 @@ ROOMS_DATA = [
 ]
 
 
-def main():
+ROOM_COLUMNS = ("hotel_id", "room_type_id", "room_number", "status", "is_active")
+
+
+def copy_rows(table, columns, rows):
+    """Stream rows into a table with PostgreSQL COPY on the session's own connection."""
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    cursor = db.session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf)
+    finally:
+        cursor.close()
+
+
+def main(app=None):
+    app = app or create_app()
     with app.app_context():
-        owner = Owner.query.filter_by(email="owner@ngendahotel.com").first()
-        if not owner:
-            owner = Owner(
-                name="Ngenda Group",
-                email="owner@ngendahotel.com",
-            )
-            db.session.add(owner)
-            db.session.flush()
+        # Owner and hotel ids come straight back from INSERT ... RETURNING, no ORM flush
+        owner_id = db.session.execute(
+            db.select(Owner.id).filter_by(email="owner@ngendahotel.com")
+        ).scalar()
+        if owner_id is None:
+            owner_id = db.session.execute(
+                insert(Owner).values(
+                    name="Ngenda Group",
+                    email="owner@ngendahotel.com",
+                ).returning(Owner.id)
+            ).scalar_one()
             print("✅ Created owner: Ngenda Group")
 
-        hotel = Hotel.query.filter_by(name="Ngenda Hotel & Apartments").first()
-        if not hotel:
-            hotel = Hotel(
-                owner_id=owner.id,
-                name="Ngenda Hotel & Apartments",
-                address="Isyesye–Hayanga",
-                city="Mbeya",
-                country="Tanzania",
-                phone="+255671271247",
-                contact_email="info@ngendahotel.com",
-                currency="TZS",
-            )
-            db.session.add(hotel)
-            db.session.commit()
+        hotel_id = db.session.execute(
+            db.select(Hotel.id).filter_by(name="Ngenda Hotel & Apartments")
+        ).scalar()
+        if hotel_id is None:
+            hotel_id = db.session.execute(
+                insert(Hotel).values(
+                    owner_id=owner_id,
+                    name="Ngenda Hotel & Apartments",
+                    address="Isyesye–Hayanga",
+                    city="Mbeya",
+                    country="Tanzania",
+                    phone="+255671271247",
+                    email="info@ngendahotel.com",
+                    currency="TZS",
+                ).returning(Hotel.id)
+            ).scalar_one()
             print("✅ Created Ngenda Hotel & Apartments")
         else:
             print("ℹ️ Ngenda Hotel already exists")
 
-        for data in ROOMS_DATA:
-            room_type = RoomType.query.filter_by(
-                hotel_id=hotel.id,
-                name=data["name"],
-            ).first()
-
-            if not room_type:
-                room_type = RoomType(
-                    hotel_id=hotel.id,
-                    name=data["name"],
-                    description=data["description"],
-                    short_description=data["short_description"],
-                    base_price=data["price"],
-                    capacity=data["capacity"],
-                    size_sqm=data["size"],
-                    bed_type=data["bed_type"],
-                    amenities=data["amenities"],
-                    is_active=True,
-                )
-                db.session.add(room_type)
-                db.session.flush()
+        names = [data["name"] for data in ROOMS_DATA]
+        type_ids = dict(db.session.execute(
+            db.select(RoomType.name, RoomType.id).filter(
+                RoomType.hotel_id == hotel_id, RoomType.name.in_(names),
+            )
+        ).all())
+        new_types = [data for data in ROOMS_DATA if data["name"] not in type_ids]
+        if new_types:
+            # One Core INSERT ... RETURNING for all new room types, skipping the ORM unit of work
+            result = db.session.execute(
+                insert(RoomType).returning(RoomType.id, RoomType.name),
+                [
+                    {
+                        "hotel_id": hotel_id,
+                        "name": data["name"],
+                        "description": data["description"],
+                        "short_description": data["short_description"],
+                        "base_price": data["price"],
+                        "capacity": data["capacity"],
+                        "size_sqm": data["size"],
+                        "bed_type": data["bed_type"],
+                        "amenities": data["amenities"],
+                        "is_active": True,
+                    }
+                    for data in new_types
+                ],
+            )
+            type_ids.update({name: type_id for type_id, name in result})
+            for data in new_types:
                 print(f"✅ Created room type: {data['name']}")
+        # Owner, hotel and room types are committed before any rooms load
+        db.session.commit()
 
-                for i in range(1, 6):
-                    room = Room(
-                        hotel_id=hotel.id,
-                        room_type_id=room_type.id,
-                        room_number=f"{data['category'][0].upper()}{i:02d}",
-                        status="Vacant",
-                        is_active=True,
-                    )
-                    db.session.add(room)
-                print(f"   Added 5 rooms")
+        # Rooms load one room type per transaction, so a large seed never holds
+        # one huge transaction. Types that have no rooms yet (new ones, or ones
+        # left empty by an interrupted run) are the ones filled in.
+        stocked = set(db.session.scalars(
+            db.select(Room.room_type_id).filter(Room.room_type_id.in_(type_ids.values())).distinct()
+        ))
+        postgresql = db.engine.dialect.name == "postgresql"
+        for data in ROOMS_DATA:
+            if type_ids[data["name"]] in stocked:
+                continue
+            rooms = [
+                {
+                    "hotel_id": hotel_id,
+                    "room_type_id": type_ids[data["name"]],
+                    "room_number": f"{data['category'][0].upper()}{i:02d}",
+                    "status": "Vacant",
+                    "is_active": True,
+                }
+                for i in range(1, 6)
+            ]
+            # COPY on PostgreSQL, one batched INSERT elsewhere
+            if postgresql:
+                copy_rows(
+                    Room.__tablename__,
+                    ROOM_COLUMNS,
+                    ([room[column] for column in ROOM_COLUMNS] for room in rooms),
+                )
+            else:
+                db.session.bulk_insert_mappings(Room, rooms)
+            db.session.commit()
+            print(f"   Added {len(rooms)} {data['name']} rooms")
 
-        db.session.commit()
         print("\n🎉 Ngenda Hotel seeded successfully!")
-        print(f"   Hotel ID: {hotel.id} (set NGENDA_HOTEL_ID={hotel.id} in .env if needed)")
+        print(f"   Hotel ID: {hotel_id} (set NGENDA_HOTEL_ID={hotel_id} in .env if needed)")
 
 
 if __name__ == "__main__":
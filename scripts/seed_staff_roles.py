@@ -3,10 +3,15 @@
 Seed additional staff roles: Receptionist, Housekeeping, Kitchen
 Run: python -m scripts.seed_staff_roles
 """
+import os
+
+from sqlalchemy import bindparam, insert, update
+
 from app import create_app
 from app.extensions import db
 from app.models import User, Role, Hotel
 from werkzeug.security import generate_password_hash
+from scripts._seed_utils import DEMO_HASH_METHOD
 
 
 def create_roles():
@@ -67,26 +72,47 @@ def create_roles():
         }
     ]
     
-    created_roles = []
+    roles = {}
+    new_roles = []
+    # Only id and name are needed downstream, so plain rows stand in for Role objects
+    existing = {
+        role.name: role
+        for role in db.session.execute(
+            db.select(Role.id, Role.name).filter(Role.name.in_([r['name'] for r in roles_data]))
+        )
+    }
+    updates = []
     for role_data in roles_data:
-        role = Role.query.filter_by(name=role_data['name']).first()
+        role = existing.get(role_data['name'])
         if not role:
-            role = Role(
-                name=role_data['name'],
-                description=role_data['description'],
-                permissions=role_data['permissions']
-            )
-            db.session.add(role)
-            created_roles.append(role)
-            print(f"✓ Created role: {role.name}")
+            new_roles.append(role_data)
         else:
-            role.description = role_data['description']
-            role.permissions = role_data['permissions']
-            created_roles.append(role)
+            updates.append({
+                'b_name': role.name,
+                'b_description': role_data['description'],
+                'b_permissions': role_data['permissions'],
+            })
+            roles[role.name] = role
             print(f"✓ Updated role: {role.name}")
     
-    db.session.commit()
-    return {r.name: r for r in created_roles}
+    # One executemany UPDATE for the existing roles
+    if updates:
+        roles_table = Role.__table__
+        db.session.execute(
+            update(roles_table)
+            .where(roles_table.c.name == bindparam('b_name'))
+            .values(description=bindparam('b_description'), permissions=bindparam('b_permissions')),
+            updates,
+        )
+    
+    # Insert all missing roles in one batched INSERT ... RETURNING
+    if new_roles:
+        for role in db.session.execute(insert(Role).returning(Role.id, Role.name), new_roles):
+            roles[role.name] = role
+            print(f"✓ Created role: {role.name}")
+    
+    # main() commits once at the end
+    return roles
 
 
 def create_staff_users(hotel_id, roles):
@@ -129,53 +155,88 @@ def create_staff_users(hotel_id, roles):
         }
     ]
     
-    created_users = []
+    users = []
+    new_users = []
+    updates = []
+    existing = {
+        user.email: user
+        for user in User.query.filter(User.email.in_([u['email'] for u in users_data]))
+    }
     for user_data in users_data:
-        user = User.query.filter_by(email=user_data['email']).first()
+        user = existing.get(user_data['email'])
         if not user:
-            user = User(
-                name=user_data['name'],
-                email=user_data['email'],
-                password_hash=generate_password_hash(user_data['password']),
-                role=user_data['role'].name,
-                role_id=user_data['role'].id,
-                hotel_id=hotel_id,
-                active=True
-            )
-            db.session.add(user)
-            created_users.append(user)
-            print(f"✓ Created user: {user.name} ({user.email}) - {user_data['description']}")
+            new_users.append({
+                'name': user_data['name'],
+                'email': user_data['email'],
+                'password_hash': generate_password_hash(user_data['password'], method=DEMO_HASH_METHOD),
+                'role': user_data['role'].name,
+                'role_id': user_data['role'].id,
+                'hotel_id': hotel_id,
+                'active': True,
+            })
         else:
-            user.name = user_data['name']
-            user.role = user_data['role'].name
-            user.role_id = user_data['role'].id
-            user.hotel_id = hotel_id
-            created_users.append(user)
-            print(f"✓ Updated user: {user.name} ({user.email})")
+            updates.append({
+                'b_email': user.email,
+                'b_name': user_data['name'],
+                'b_role': user_data['role'].name,
+                'b_role_id': user_data['role'].id,
+                'b_hotel_id': hotel_id,
+            })
+            users.append(user)
+    
+    # Refresh every existing user with one executemany UPDATE instead of a
+    # per-object flush; the loaded objects are expired so they reload fresh
+    if updates:
+        users_table = User.__table__
+        db.session.execute(
+            update(users_table)
+            .where(users_table.c.email == bindparam('b_email'))
+            .values(
+                name=bindparam('b_name'),
+                role=bindparam('b_role'),
+                role_id=bindparam('b_role_id'),
+                hotel_id=bindparam('b_hotel_id'),
+            ),
+            updates,
+        )
+        for user in users:
+            db.session.expire(user)
+        for row in updates:
+            print(f"✓ Updated user: {row['b_name']} ({row['b_email']})")
+    
+    # Insert all missing users in one batched INSERT ... RETURNING
+    if new_users:
+        for user in db.session.scalars(insert(User).returning(User), new_users):
+            users.append(user)
+            print(f"✓ Created user: {user.name} ({user.email})")
     
-    db.session.commit()
-    return created_users
+    return users
 
 
-def main():
-    app = create_app()
+def main(app=None):
+    app = app or create_app()
     with app.app_context():
         print("=== Seeding Staff Roles and Users ===\n")
         
-        hotel = Hotel.query.filter_by(name='Demo Hotel').first()
-        if not hotel:
-            hotel = Hotel.query.first()
+        # Only the id is needed, so select the scalar rather than loading a Hotel
+        hotel_id = (
+            os.environ.get('DEMO_HOTEL_ID')
+            or db.session.scalar(db.select(Hotel.id).filter_by(name='Demo Hotel'))
+            or db.session.scalar(db.select(Hotel.id).order_by(Hotel.id).limit(1))
+        )
         
-        if not hotel:
+        if not hotel_id:
             print("✗ No hotel found. Please run seed_demo.py first.")
             return
         
-        print(f"Using hotel: {hotel.name} (ID: {hotel.id})\n")
+        hotel_id = int(hotel_id)
+        print(f"Using hotel ID: {hotel_id}\n")
         
         roles = create_roles()
         print()
 
-        users = create_staff_users(hotel.id, roles)
+        users = create_staff_users(hotel_id, roles)
+        db.session.commit()
         print()
         
         print("=== Staff Credentials ===\n")
@@ -6,18 +6,20 @@ os.environ.setdefault("FLASK_APP", "app")
 
 from app import create_app
 from app.extensions import db
-from app.models.user import User
+from app.models import User
 from werkzeug.security import generate_password_hash
+from scripts._seed_utils import DEMO_HASH_METHOD
 
-def main():
-    app = create_app()
+
+def main(app=None):
+    app = app or create_app()
     with app.app_context():
         if User.query.filter_by(email="admin@hotel.com").first():
             print("Superadmin already exists.")
             return
         u = User(
             email="admin@hotel.com",
-            password_hash=generate_password_hash("admin123"),
+            password_hash=generate_password_hash("admin123", method=DEMO_HASH_METHOD),
             role="superadmin",
             is_superadmin=True,
             hotel_id=None,
@@ -2,17 +2,29 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import update
+
 from app import create_app
 from app.extensions import db
-from app.models.hotel import Hotel
-from app.models.owner import Owner
+from app.models import Hotel, Owner
 
 app = create_app()
 
 with app.app_context():
-    hotel = Hotel.query.filter_by(name='Ngenda Hotel & Apartments').first()
+    # Refresh the website fields with a single UPDATE; no rows matched means
+    # the hotel still has to be created
+    updated = db.session.execute(
+        update(Hotel)
+        .where(Hotel.name == 'Ngenda Hotel & Apartments')
+        .values(
+            website_url='https://hotel.ngendagroup.africa',
+            display_name='Ngenda Hotel',
+            email_footer_text='Thank you for choosing Ngenda Hotel. We look forward to welcoming you!',
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
 
-    if not hotel:
+    if not updated:
         owner = Owner.query.filter_by(email='info@ngendahotel.com').first()
         if not owner:
             owner = Owner(
@@ -48,8 +60,5 @@ with app.app_context():
         db.session.commit()
         print("✅ Created Ngenda Hotel")
     else:
-        hotel.website_url = 'https://hotel.ngendagroup.africa'
-        hotel.display_name = 'Ngenda Hotel'
-        hotel.email_footer_text = 'Thank you for choosing Ngenda Hotel. We look forward to welcoming you!'
         db.session.commit()
         print("✅ Updated Ngenda Hotel")
@@ -0,0 +1,163 @@
+"""Shared fixtures: one app and schema per test session, one rolled-back transaction per test."""
+from functools import partial
+
+import pytest
+import werkzeug.security
+from sqlalchemy import event, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+# Test passwords need no work factor. Patch before the app and test modules
+# import generate_password_hash by name; check_password_hash reads the method
+# from the stored hash, so verification keeps working unchanged.
+werkzeug.security.generate_password_hash = partial(
+    werkzeug.security.generate_password_hash, method="pbkdf2:sha256:1"
+)
+
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.models import Hotel, Owner, Room, RoomType, User
+
+
+def _enable_sqlite_savepoints(engine):
+    """Let SQLAlchemy emit BEGIN itself; pysqlite's implicit transactions break SAVEPOINT."""
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _worker_database_uri(uri, worker):
+    """Give each pytest-xdist worker its own database.
+
+    In-memory SQLite is already private to the worker process; any other URL
+    gets the worker id appended to its database name (test_db -> test_db_gw0),
+    which must exist before the run.
+    """
+    if worker == "master" or uri == "sqlite:///:memory:":
+        return uri
+    url = make_url(uri)
+    return url.set(database=f"{url.database}_{worker}").render_as_string(hide_password=False)
+
+
+@pytest.fixture(scope="session")
+def app(request):
+    """Build the app and its schema once for the whole run."""
+    worker = getattr(request.config, "workerinput", {}).get("workerid", "master")
+    config = type("WorkerTestingConfig", (TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": _worker_database_uri(TestingConfig.SQLALCHEMY_DATABASE_URI, worker),
+    })
+    app = create_app(config)
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            _enable_sqlite_savepoints(db.engine)
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture(scope="session")
+def seed_hotel(app):
+    """Owner, hotel, manager, room type and rooms shared by every test module.
+
+    Committed once per session, so tests must treat these rows as read-only;
+    returns plain ids so nothing is tied to a session.
+    """
+    owner = Owner(name="Ngenda Group", email="owner@ngendahotel.com")
+    db.session.add(owner)
+    db.session.flush()
+    hotel = Hotel(
+        owner_id=owner.id,
+        name="Ngenda Hotel & Apartments",
+        address="Isyesye–Hayanga",
+        city="Mbeya",
+        country="Tanzania",
+        phone="+255671271247",
+        email="info@ngendahotel.com",
+        currency="TZS",
+    )
+    db.session.add(hotel)
+    db.session.flush()
+    manager = User(
+        email="manager@test.com",
+        password_hash=werkzeug.security.generate_password_hash("testpass123"),
+        role="manager",
+        hotel_id=hotel.id,
+    )
+    room_type = RoomType(
+        hotel_id=hotel.id,
+        name="Classic Room",
+        base_price=80000,
+        capacity=2,
+        size_sqm="25",
+        bed_type="Double",
+        amenities=["AC", "WiFi"],
+        is_active=True,
+    )
+    db.session.add_all([manager, room_type])
+    db.session.flush()
+    room_ids = db.session.scalars(
+        insert(Room).returning(Room.id),
+        [
+            {
+                "hotel_id": hotel.id,
+                "room_type_id": room_type.id,
+                "room_number": f"C{i:02d}",
+                "status": "Vacant",
+                "is_active": True,
+            }
+            for i in range(1, 4)
+        ],
+    ).all()
+    seed = {
+        "owner_id": owner.id,
+        "hotel_id": hotel.id,
+        "manager_user_id": manager.id,
+        "room_type_id": room_type.id,
+        "room_ids": room_ids,
+    }
+    db.session.commit()
+    return seed
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def db_session(app):
+    """Run each test inside an outer transaction that is rolled back afterwards.
+
+    db.session is swapped for a session that joins that transaction through a
+    SAVEPOINT, so commit() in fixtures and views only releases the savepoint and
+    nothing outlives the test.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    app_session = db.session
+    db.session = scoped_session(
+        sessionmaker(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            # Nothing outlives the test, so there is no stale state to re-SELECT after commit
+            expire_on_commit=False,
+        )
+    )
+    try:
+        yield db.session
+    finally:
+        db.session.remove()
+        db.session = app_session
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(autouse=True)
+def _rollback_every_test(db_session):
+    """Run every test inside db_session so nothing it writes leaks into the next one."""
+    yield
@@ -1,94 +1,44 @@
 import pytest
-import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
 from werkzeug.security import generate_password_hash
 from flask import url_for
-from app import create_app
 from app.extensions import db
-from app.models.user import User
-from app.models.hotel import Hotel
-from app.models.owner import Owner
-from app.models.room import Room, RoomType
-from app.models.booking import Booking, Guest
-from app.models.inventory import (
-    InventoryCategory, InventoryItem, Supplier, PurchaseOrder, 
-    PurchaseOrderItem, StockMovement
+from app.models import (
+    User, Hotel, Owner, Room, RoomType, Booking, Guest,
+    InventoryCategory, InventoryItem, Supplier, PurchaseOrder,
+    PurchaseOrderItem, StockMovement, HousekeepingTask, MaintenanceIssue,
+    JournalEntry, ChartOfAccount, JournalLine,
 )
-from app.models.housekeeping import HousekeepingTask, MaintenanceIssue
-from app.models.accounting import JournalEntry, ChartOfAccount, JournalLine
 
-@pytest.fixture(scope='module')
-def app():
-    """Create and configure a new app instance for testing."""
-    app = create_app('testing')
-    with app.app_context():
-        yield app
-
-@pytest.fixture(scope='module')
-def client(app):
-    """A test client for the app."""
-    return app.test_client()
-
-@pytest.fixture(scope='module')
-def init_database(app):
-    """Initialize the database with test data."""
-    with app.app_context():
-        db.create_all()
-        
-        # No roles to create - using string roles
-        
-        # Create test account types
-        for acc_type in ['Asset', 'Liability', 'Revenue', 'Expense']:
-            if not ChartOfAccount.query.filter_by(type=acc_type).first():
-                account = ChartOfAccount(
-                    name=f'Test {acc_type} Account',
-                    type=acc_type,
-                    hotel_id=1  # Will be set after hotel creation
-                )
-                db.session.add(account)
-        
-        db.session.commit()
-        
-        yield db
-        
-        # Clean up after tests
-        db.session.remove()
-        db.drop_all()
-
-@pytest.fixture(scope='function')
-def test_hotel(init_database):
-    """Create a test hotel."""
-    # Create an owner first
-    owner = Owner(
-        name='Test Owner',
-        email=f'owner_{uuid.uuid4().hex[:8]}@test.com'
-    )
-    db.session.add(owner)
-    db.session.flush()
+@pytest.fixture(scope='session')
+def init_database(app, seed_hotel):
+    """Initialize the database with test data once per session."""
+    # No roles to create - using string roles
+    
+    # Create test account types for the shared seed hotel
+    for acc_type in ['Asset', 'Liability', 'Revenue', 'Expense']:
+        if not ChartOfAccount.query.filter_by(type=acc_type).first():
+            account = ChartOfAccount(
+                name=f'Test {acc_type} Account',
+                type=acc_type,
+                hotel_id=seed_hotel['hotel_id']
+            )
+            db.session.add(account)
     
-    hotel = Hotel(
-        name='Test Hotel',
-        location='123 Test St, Test City, Test Country',
-        currency='USD',
-        owner_id=owner.id
-    )
-    db.session.add(hotel)
     db.session.commit()
-    return hotel
+    
+    return db
 
 @pytest.fixture(scope='function')
-def test_user(init_database, test_hotel):
-    """Create a test manager user."""
-    user = User(
-        email=f'manager_{uuid.uuid4().hex[:8]}@test.com',
-        password_hash=generate_password_hash('testpass123'),
-        role='manager',
-        hotel_id=test_hotel.id
-    )
-    db.session.add(user)
-    db.session.commit()
-    return user
+def test_hotel(init_database, seed_hotel, db_session):
+    """The shared seed hotel."""
+    return db.session.get(Hotel, seed_hotel['hotel_id'])
+
+@pytest.fixture(scope='function')
+def test_user(init_database, seed_hotel, test_hotel):
+    """The shared seed manager user."""
+    return db.session.get(User, seed_hotel['manager_user_id'])
 
 @pytest.fixture(scope='function')
 def test_supplier(init_database, test_hotel):
@@ -101,7 +51,7 @@ def test_supplier(init_database, test_hotel):
         hotel_id=test_hotel.id
     )
     db.session.add(supplier)
-    db.session.commit()
+    db.session.flush()
     return supplier
 
 @pytest.fixture(scope='function')
@@ -113,7 +63,7 @@ def test_category(init_database, test_hotel):
         hotel_id=test_hotel.id
     )
     db.session.add(category)
-    db.session.commit()
+    db.session.flush()
     return category
 
 @pytest.fixture(scope='function')
@@ -121,7 +71,7 @@ def test_item(init_database, test_hotel, test_category):
     """Create a test inventory item."""
     item = InventoryItem(
         name='Test Item',
-        sku=f'TEST{uuid.uuid4().hex[:8].upper()}',
+        sku='TEST0001',
         description='Test item for testing',
         category_id=test_category.id,
         unit='pcs',
@@ -131,10 +81,10 @@ def test_item(init_database, test_hotel, test_category):
         hotel_id=test_hotel.id
     )
     db.session.add(item)
-    db.session.commit()
+    db.session.flush()
     return item
 
-def test_inventory_workflow(client, init_database, test_user, test_hotel, test_supplier, test_category):
+def test_inventory_workflow(client, init_database, test_user, test_hotel, test_supplier, test_category, test_item):
     """Test the complete inventory workflow."""
     # For now, just verify our test setup works
     assert test_hotel is not None
@@ -147,7 +97,7 @@ def test_inventory_workflow(client, init_database, test_user, test_hotel, test_s
     # Create a test item directly in the database
     item = InventoryItem(
         name='Test Workflow Item',
-        sku=f'WORKFLOW{uuid.uuid4().hex[:8].upper()}',
+        sku='WORKFLOW0001',
         description='Test item for workflow',
         category_id=test_category.id,
         unit='pcs',
@@ -157,7 +107,7 @@ def test_inventory_workflow(client, init_database, test_user, test_hotel, test_s
         hotel_id=test_hotel.id
     )
     db.session.add(item)
-    db.session.commit()
+    db.session.flush()
     
     # Verify item was created
     created_item = InventoryItem.query.filter_by(sku=item.sku).first()
@@ -177,14 +127,14 @@ def test_inventory_workflow(client, init_database, test_user, test_hotel, test_s
         created_by=test_user.id
     )
     db.session.add(movement)
-    db.session.commit()
+    db.session.flush()
     
     # Update item stock
     created_item.current_stock = 75
     db.session.commit()
     
     # Verify stock was updated
-    updated_item = InventoryItem.query.get(created_item.id)
+    updated_item = db.session.get(InventoryItem, created_item.id)
     assert updated_item.current_stock == 75
     
     # Verify movement was recorded
@@ -194,58 +144,38 @@ def test_inventory_workflow(client, init_database, test_user, test_hotel, test_s
     
     print("✓ Basic inventory workflow test passed")
 
-def test_stock_adjustment(client, init_database, test_user, test_item):
+@pytest.mark.parametrize('delta,expected,notes', [
+    (25, 125, 'Test add stock'),
+    (-15, 85, 'Test remove stock'),
+])
+def test_stock_adjustment(client, init_database, test_user, test_item, delta, expected, notes):
     """Test stock adjustment functionality."""
     # Test database-level stock adjustments without HTTP endpoints
-    # 1. Add stock
-    movement_add = StockMovement(
+    movement = StockMovement(
         item_id=test_item.id,
         movement_type='adjustment',
-        quantity=25,
+        quantity=delta,
         unit_cost=test_item.average_cost,
         previous_stock=test_item.current_stock,
-        new_stock=test_item.current_stock + 25,
-        hotel_id=test_item.hotel_id,
-        created_by=test_user.id,
-        notes='Test add stock'
-    )
-    db.session.add(movement_add)
-    db.session.commit()
-    
-    # Update item stock
-    test_item.current_stock = 125  # 100 + 25
-    db.session.commit()
-    
-    # Verify stock was increased
-    item = InventoryItem.query.get(test_item.id)
-    assert item.current_stock == 125
-    
-    # 2. Remove stock
-    movement_remove = StockMovement(
-        item_id=test_item.id,
-        movement_type='adjustment',
-        quantity=-15,
-        unit_cost=test_item.average_cost,
-        previous_stock=item.current_stock,
-        new_stock=item.current_stock - 15,
+        new_stock=test_item.current_stock + delta,
         hotel_id=test_item.hotel_id,
         created_by=test_user.id,
-        notes='Test remove stock'
+        notes=notes
     )
-    db.session.add(movement_remove)
-    db.session.commit()
+    db.session.add(movement)
     
-    # Update item stock
-    test_item.current_stock = 110  # 125 - 15
+    # Update item stock (starts at 100)
+    test_item.current_stock = expected
     db.session.commit()
     
-    # Verify stock was decreased
-    item = InventoryItem.query.get(test_item.id)
-    assert item.current_stock == 110
+    # Verify stock was adjusted
+    item = db.session.get(InventoryItem, test_item.id)
+    assert item.current_stock == expected
     
-    # Verify stock movements were recorded
+    # Verify the stock movement was recorded
     movements = StockMovement.query.filter_by(item_id=test_item.id).all()
-    assert len(movements) >= 2  # At least our two adjustments
+    assert len(movements) == 1
+    assert movements[0].quantity == delta
     
     print("✓ Stock adjustment test passed")
 
@@ -268,7 +198,7 @@ def test_housekeeping_integration(client, init_database, test_user, test_hotel,
         hotel_id=test_hotel.id
     )
     db.session.add(room)
-    db.session.commit()
+    db.session.flush()
     
     # 2. Create a housekeeping task that uses inventory
     task = HousekeepingTask(
@@ -280,7 +210,7 @@ def test_housekeeping_integration(client, init_database, test_user, test_hotel,
         notes='Test cleaning task'
     )
     db.session.add(task)
-    db.session.commit()
+    db.session.flush()
     
     # 3. Create a maintenance issue that might use inventory
     issue = MaintenanceIssue(
@@ -296,23 +226,24 @@ def test_housekeeping_integration(client, init_database, test_user, test_hotel,
     db.session.commit()
     
     # Verify housekeeping task was created
-    created_task = HousekeepingTask.query.get(task.id)
+    created_task = db.session.get(HousekeepingTask, task.id)
     assert created_task is not None
     assert created_task.room_id == room.id
     assert created_task.status == 'pending'
     
     # Verify maintenance issue was created
-    created_issue = MaintenanceIssue.query.get(issue.id)
+    created_issue = db.session.get(MaintenanceIssue, issue.id)
     assert created_issue is not None
     assert created_issue.room_id == room.id
     assert created_issue.status == 'reported'
     
     # Verify room has relationships to housekeeping
-    room_with_tasks = Room.query.get(room.id)
+    room_with_tasks = db.session.get(Room, room.id)
     assert room_with_tasks is not None
     
     print("✓ Housekeeping integration test passed")
 
+@pytest.mark.slow
 def test_multi_hotel_isolation(client, init_database, test_user, test_hotel):
     """Test that data is properly isolated between hotels."""
     # Create an item in Hotel A
@@ -325,19 +256,19 @@ def test_multi_hotel_isolation(client, init_database, test_user, test_hotel):
     
     item_a = InventoryItem(
         name='Hotel A Item',
-        sku=f'HOTELA{uuid.uuid4().hex[:8].upper()}',
+        sku='HOTELA0001',
         current_stock=100,
         category_id=category_a.id,
         unit='pcs',
         hotel_id=test_hotel.id
     )
     db.session.add(item_a)
-    db.session.commit()
+    db.session.flush()
     
     # Create Hotel B and its manager
     owner_b = Owner(
         name='Hotel B Owner',
-        email=f'ownerb_{uuid.uuid4().hex[:8]}@test.com'
+        email='ownerb@test.com'
     )
     db.session.add(owner_b)
     db.session.flush()
@@ -349,15 +280,17 @@ def test_multi_hotel_isolation(client, init_database, test_user, test_hotel):
         owner_id=owner_b.id
     )
     db.session.add(hotel_b)
+    db.session.flush()
     
     user_b = User(
-        email=f'managerb_{uuid.uuid4().hex[:8]}@test.com',
+        email='managerb@test.com',
         password_hash=generate_password_hash('testpass123'),
         role='manager',
         hotel_id=hotel_b.id
     )
     db.session.add(user_b)
-    db.session.commit()
+    db.session.flush()
+    assert user_b.hotel_id == hotel_b.id
     
     # Create an item in Hotel B
     category_b = InventoryCategory(
@@ -369,7 +302,7 @@ def test_multi_hotel_isolation(client, init_database, test_user, test_hotel):
     
     item_b = InventoryItem(
         name='Hotel B Item',
-        sku=f'HOTELB{uuid.uuid4().hex[:8].upper()}',
+        sku='HOTELB0001',
         current_stock=50,
         category_id=category_b.id,
         unit='pcs',
@@ -379,26 +312,24 @@ def test_multi_hotel_isolation(client, init_database, test_user, test_hotel):
     db.session.commit()
     
     # Test data isolation - verify each hotel only sees its own data
-    # Hotel A should only see Hotel A items
-    hotel_a_items = InventoryItem.query.filter_by(hotel_id=test_hotel.id).all()
-    assert len(hotel_a_items) >= 1  # At least the item we created
-    
-    # Verify Hotel A items belong to Hotel A
-    for item in hotel_a_items:
-        assert item.hotel_id == test_hotel.id
-    
-    # Hotel B should only see Hotel B items
-    hotel_b_items = InventoryItem.query.filter_by(hotel_id=hotel_b.id).all()
-    assert len(hotel_b_items) >= 1  # At least the item we created
-    
-    # Verify Hotel B items belong to Hotel B
-    for item in hotel_b_items:
-        assert item.hotel_id == hotel_b.id
-    
-    # Verify no cross-contamination
-    hotel_a_skus = {item.sku for item in hotel_a_items}
-    hotel_b_skus = {item.sku for item in hotel_b_items}
-    assert hotel_a_skus.isdisjoint(hotel_b_skus)
+    # Count each hotel's items in the database instead of loading and re-checking rows
+    hotel_ids = [test_hotel.id, hotel_b.id]
+    item_counts = dict(db.session.execute(
+        db.select(InventoryItem.hotel_id, db.func.count())
+        .where(InventoryItem.hotel_id.in_(hotel_ids))
+        .group_by(InventoryItem.hotel_id)
+    ).all())
+    assert item_counts.get(test_hotel.id, 0) >= 1  # At least the item we created
+    assert item_counts.get(hotel_b.id, 0) >= 1  # At least the item we created
+    
+    # Verify no cross-contamination: no SKU is stocked by both hotels
+    shared_skus = db.session.scalars(
+        db.select(InventoryItem.sku)
+        .where(InventoryItem.hotel_id.in_(hotel_ids))
+        .group_by(InventoryItem.sku)
+        .having(db.func.count(db.distinct(InventoryItem.hotel_id)) > 1)
+    ).all()
+    assert shared_skus == []
     
     print("✓ Multi-hotel data isolation test passed")
 
@@ -411,8 +342,19 @@ def test_generate_report(client, init_database, test_user, test_item):
     assert test_item in inventory_items
     
     # 2. Test stock movement query
+    db.session.add(StockMovement(
+        item_id=test_item.id,
+        movement_type='adjustment',
+        quantity=5,
+        unit_cost=test_item.average_cost,
+        previous_stock=test_item.current_stock,
+        new_stock=test_item.current_stock + 5,
+        hotel_id=test_item.hotel_id,
+        created_by=test_user.id,
+    ))
+    db.session.flush()
     movements = StockMovement.query.filter_by(item_id=test_item.id).all()
-    assert len(movements) >= 0  # At least the movements from other tests
+    assert len(movements) == 1  # Nothing carries over from other tests
     
     # 3. Test low stock items query
     low_stock_items = InventoryItem.query.filter(